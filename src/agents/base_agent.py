@@ -36,29 +36,46 @@ class BaseAgent:
         self.message_history: List[Dict[str, Any]] = []
         self.task_queue: asyncio.Queue = asyncio.Queue()
         self.running = False
+        self._loop_task: Optional[asyncio.Task] = None
     
     async def start(self):
         """Start the agent's task processing loop."""
         self.running = True
-        await self._process_task_loop()
+        self._loop_task = asyncio.current_task()
+        try:
+            await self._process_task_loop()
+        except asyncio.CancelledError:
+            self.running = False
+            raise
+        finally:
+            self._loop_task = None
     
     async def stop(self):
-        """Stop the agent's task processing loop."""
+        """
+        Stop the agent's task processing loop.
+        
+        The loop is usually blocked waiting for the next task, so it is
+        cancelled rather than left to notice the running flag.
+        """
         self.running = False
+        if self._loop_task is not None and self._loop_task is not asyncio.current_task():
+            self._loop_task.cancel()
     
     async def _process_task_loop(self):
         """Main processing loop for handling tasks."""
         while self.running:
+            task = await self.task_queue.get()
             try:
-                task = await self.task_queue.get()
                 result = await self.process_task(task)
-                self.task_queue.task_done()
                 
                 # If the task generated a response or notification, handle it
                 if result and isinstance(result, dict) and result.get('type') == 'message':
                     await self._handle_outgoing_message(result)
             except Exception as e:
                 print(f"Error processing task in agent {self.agent_id}: {str(e)}")
+            finally:
+                # Always mark the task done so task_queue.join() waiters are released
+                self.task_queue.task_done()
     
     async def receive_message(self, message: Dict[str, Any]) -> None:
         """
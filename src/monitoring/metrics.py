@@ -361,11 +361,11 @@ def timed(name: str, labels: Dict[str, str] = None) -> Callable[[F], F]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             labels_dict = labels or {}
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 registry.observe_histogram(name, duration, labels_dict)
         return cast(F, wrapper)
     return decorator
@@ -425,7 +425,7 @@ class MetricsMiddleware:
         path = scope.get("path", "/")
         
         # Start timing the request
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Modified send function to capture response status
         status_code = [None]
@@ -454,7 +454,7 @@ class MetricsMiddleware:
                 )
                 
                 # Record request duration
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 registry.observe_histogram(
                     "http_request_duration_seconds",
                     duration,
@@ -38,7 +38,12 @@ from .api_service import (
 )
 
 from .openapi_spec import (
-    generate_openapi_spec, save_openapi_spec
+    generate_openapi_spec, generate_openapi_spec_json, generate_openapi_spec_json_gz,
+    generate_spec_skeleton,
+    generate_path_spec, save_openapi_spec,
+    spec_etag, spec_last_modified, spec_not_modified, openapi_spec_response,
+    validate_spec, iter_openapi_spec_json, stream_openapi_spec, endpoint_keys,
+    clear_spec_cache, get_compiled_validator
 )
 
 
@@ -118,9 +123,13 @@ __all__ = [
     'api_service',
     
     # OpenAPI
-    'generate_openapi_spec', 'save_openapi_spec',
+    'generate_openapi_spec', 'generate_openapi_spec_json', 'generate_openapi_spec_json_gz',
+    'generate_spec_skeleton',
+    'generate_path_spec', 'save_openapi_spec',
+    'spec_etag', 'spec_last_modified', 'spec_not_modified', 'openapi_spec_response',
+    'validate_spec', 'iter_openapi_spec_json', 'stream_openapi_spec', 'endpoint_keys',
+    'clear_spec_cache', 'get_compiled_validator',
     
     # Initialization
     'initialize_orchestration_layer'
 ]
-"""
\ No newline at end of file
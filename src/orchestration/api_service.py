@@ -1107,4 +1107,3 @@ async def handle_api_request(
         API response
     """
     return await api_service.handle_request(path, method, data, auth_token)
-"""
\ No newline at end of file
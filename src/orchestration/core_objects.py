@@ -36,6 +36,8 @@ class AuthenticationDO(BaseDurableObject):
     Handles user authentication, authorization, and session management.
     """
     
+    __slots__ = ()
+    
     async def handle_login(self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Handle login request
@@ -280,6 +282,8 @@ class UserManagementDO(BaseDurableObject):
     Handles user profile management, user settings, and user-related operations.
     """
     
+    __slots__ = ()
+    
     async def handle_get_user(self, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get a user by ID
@@ -465,6 +469,8 @@ class DataStorageDO(BaseDurableObject):
     Handles persistent data storage and retrieval for the system.
     """
     
+    __slots__ = ()
+    
     async def initialize(self) -> None:
         """Initialize the Data Storage object"""
         # Initialize collections map if not exists
@@ -721,6 +727,8 @@ class APIGatewayDO(BaseDurableObject):
     Handles API requests, routing, and API key management.
     """
     
+    __slots__ = ()
+    
     async def initialize(self) -> None:
         """Initialize the API Gateway object"""
         # Initialize routes map if not exists
@@ -1182,4 +1190,3 @@ registry.register_object_type("AuthenticationDO", AuthenticationDO)
 registry.register_object_type("UserManagementDO", UserManagementDO)
 registry.register_object_type("DataStorageDO", DataStorageDO)
 registry.register_object_type("APIGatewayDO", APIGatewayDO)
-"""
\ No newline at end of file
@@ -10,6 +10,7 @@ import asyncio
 import json
 import uuid
 from datetime import datetime
+from itertools import count
 from typing import Any, Dict, List, Optional, Union, TypeVar, Generic, Callable
 
 # Type variables for generic database operations
@@ -268,6 +269,18 @@ class DataStore(Generic[T, ID]):
         """
         raise NotImplementedError
     
+    async def read_many(self, ids: List[ID]) -> List[Optional[T]]:
+        """
+        Read several items from the data store by ID
+        
+        Args:
+            ids: The IDs of the items to read
+            
+        Returns:
+            The items in the order of ids, None for items not found
+        """
+        return [await self.read(id) for id in ids]
+    
     async def update(self, id: ID, item: T) -> Optional[T]:
         """
         Update an item in the data store
@@ -281,6 +294,19 @@ class DataStore(Generic[T, ID]):
         """
         raise NotImplementedError
     
+    async def patch(self, id: ID, changes: Dict[str, Any]) -> Optional[T]:
+        """
+        Update selected fields of an item in the data store
+        
+        Args:
+            id: The ID of the item to update
+            changes: Field names and their new values
+            
+        Returns:
+            The updated item if found, None otherwise
+        """
+        raise NotImplementedError
+    
     async def delete(self, id: ID) -> bool:
         """
         Delete an item from the data store
@@ -293,12 +319,17 @@ class DataStore(Generic[T, ID]):
         """
         raise NotImplementedError
     
-    async def list(self, filter_func: Optional[Callable[[T], bool]] = None) -> List[T]:
+    async def list(
+        self,
+        filter_func: Optional[Callable[[T], bool]] = None,
+        **filters: Any
+    ) -> List[T]:
         """
         List items from the data store, optionally filtered
         
         Args:
             filter_func: Optional function to filter items
+            **filters: Optional attribute values that items must match
             
         Returns:
             List of items matching the filter
@@ -314,39 +345,140 @@ class InMemoryDataStore(DataStore[T, ID]):
     It's suitable for development, testing, or small-scale deployments.
     """
     
-    def __init__(self):
-        """Initialize a new in-memory data store"""
+    def __init__(self, indexed_fields: Optional[List[str]] = None):
+        """
+        Initialize a new in-memory data store
+        
+        Args:
+            indexed_fields: Optional item attributes to maintain secondary
+                            indexes for, used by keyword filters in list()
+        """
         self._store: Dict[ID, T] = {}
+        # Creation sequence number of every stored id, used to return indexed
+        # listings in store order like an unindexed scan
+        self._positions: Dict[ID, int] = {}
+        self._next_position = count()
+        # Index buckets are dicts used as ordered sets
+        self._indexes: Dict[str, Dict[Any, Dict[ID, None]]] = {
+            field: {} for field in (indexed_fields or [])
+        }
+    
+    def _index_values(self, item: T) -> Dict[str, Any]:
+        """Snapshot the indexed attribute values of an item"""
+        return {field: getattr(item, field, None) for field in self._indexes}
+    
+    def _index(self, id: ID, item: T) -> None:
+        """Add an item to the secondary indexes"""
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(item, field, None), {})[id] = None
+    
+    def _unindex(self, id: ID, item: T) -> None:
+        """Remove an item from the secondary indexes"""
+        for field, index in self._indexes.items():
+            self._discard(index, getattr(item, field, None), id)
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[ID, None]], value: Any, id: ID) -> None:
+        """Remove an id from one index bucket, dropping the bucket once empty"""
+        ids = index.get(value)
+        if ids is not None:
+            ids.pop(id, None)
+            if not ids:
+                del index[value]
+    
+    def _reindex(self, id: ID, previous: Dict[str, Any], item: T) -> None:
+        """Move an item between index buckets for the fields that changed"""
+        for field, old_value in previous.items():
+            value = getattr(item, field, None)
+            if value != old_value:
+                index = self._indexes[field]
+                self._discard(index, old_value, id)
+                index.setdefault(value, {})[id] = None
     
     async def create(self, item: T) -> T:
         """Create a new item in the store"""
         if hasattr(item, 'id'):
-            self._store[getattr(item, 'id')] = item
+            id = getattr(item, 'id')
+            previous = self._store.get(id)
+            self._store[id] = item
+            if previous is not None:
+                self._reindex(id, self._index_values(previous), item)
+            else:
+                self._positions[id] = next(self._next_position)
+                self._index(id, item)
         return item
     
     async def read(self, id: ID) -> Optional[T]:
         """Read an item from the store by ID"""
         return self._store.get(id)
     
+    async def read_many(self, ids: List[ID]) -> List[Optional[T]]:
+        """Read several items from the store by ID"""
+        get = self._store.get
+        return [get(id) for id in ids]
+    
     async def update(self, id: ID, item: T) -> Optional[T]:
         """Update an item in the store"""
         if id in self._store:
             if hasattr(item, 'updated_at'):
                 setattr(item, 'updated_at', datetime.utcnow().isoformat())
+            previous = self._index_values(self._store[id])
             self._store[id] = item
+            self._reindex(id, previous, item)
             return item
         return None
     
+    async def patch(self, id: ID, changes: Dict[str, Any]) -> Optional[T]:
+        """Update selected fields of an item in the store"""
+        item = self._store.get(id)
+        if item is None:
+            return None
+        previous = self._index_values(item)
+        for field, value in changes.items():
+            setattr(item, field, value)
+        if hasattr(item, 'updated_at'):
+            setattr(item, 'updated_at', datetime.utcnow().isoformat())
+        self._reindex(id, previous, item)
+        return item
+    
     async def delete(self, id: ID) -> bool:
         """Delete an item from the store"""
         if id in self._store:
-            del self._store[id]
+            self._unindex(id, self._store.pop(id))
+            del self._positions[id]
             return True
         return False
     
-    async def list(self, filter_func: Optional[Callable[[T], bool]] = None) -> List[T]:
+    async def list(
+        self,
+        filter_func: Optional[Callable[[T], bool]] = None,
+        **filters: Any
+    ) -> List[T]:
         """List items from the store, optionally filtered"""
-        items = list(self._store.values())
+        indexed = [field for field in filters if field in self._indexes]
+        if indexed:
+            # Walk the smallest matching bucket, keep the ids present in every
+            # other bucket, then restore store order; items moved between
+            # buckets sit out of order, so the sort is over nearly sorted ids
+            buckets = sorted(
+                (self._indexes[field].get(filters[field], {}) for field in indexed),
+                key=len
+            )
+            smallest, others = buckets[0], buckets[1:]
+            ids = [id for id in smallest if all(id in bucket for bucket in others)]
+            ids.sort(key=self._positions.__getitem__)
+            items = [self._store[id] for id in ids]
+        else:
+            items = list(self._store.values())
+        
+        unindexed = [(field, value) for field, value in filters.items() if field not in self._indexes]
+        if unindexed:
+            # Missing attributes compare as None, as they are indexed
+            def matches(item: T) -> bool:
+                return all(getattr(item, field, None) == value for field, value in unindexed)
+            if filter_func:
+                return [item for item in items if matches(item) and filter_func(item)]
+            return [item for item in items if matches(item)]
         if filter_func:
             items = [item for item in items if filter_func(item)]
         return items
@@ -355,7 +487,8 @@ class InMemoryDataStore(DataStore[T, ID]):
 # Database instances for different model types
 user_store = InMemoryDataStore[User, str]()
 project_store = InMemoryDataStore[Project, str]()
-durable_object_store = InMemoryDataStore[DurableObject, str]()
+durable_object_store = InMemoryDataStore[DurableObject, str](
+    indexed_fields=['project_id', 'object_type', 'status']
+)
 api_key_store = InMemoryDataStore[APIKey, str]()
 task_store = InMemoryDataStore[Task, str]()
-"""
\ No newline at end of file
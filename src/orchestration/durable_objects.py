@@ -8,13 +8,33 @@ a microservices-like architecture with persistent, isolated units of computation
 import asyncio
 import json
 import logging
-import uuid
+import os
+import time
+import weakref
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Type, TypeVar, Callable, Union
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar, Callable, Union
 
 from .database import DurableObject, durable_object_store, user_store, project_store
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to canonical JSON bytes with sorted keys, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which the json module can encode
+            pass
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +42,67 @@ logger = logging.getLogger(__name__)
 # Type variable for the durable object class
 T = TypeVar('T', bound='BaseDurableObject')
 
+# Delay before dirty objects are written back to the data store, so that
+# bursts of state changes are coalesced into a single write per object
+FLUSH_INTERVAL_MS = 50
+
+# Lifecycle statuses a Durable Object can be in
+_VALID_STATUSES = frozenset({"initializing", "active", "idle", "hibernating", "terminating"})
+
+# Statuses the idle sweep may hibernate an object from
+_HIBERNATABLE_STATUSES = frozenset({"active", "idle"})
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _uuid7() -> str:
+    """
+    Generate a time-ordered UUID version 7 string
+    
+    Returns:
+        A UUID whose leading 48 bits are the current Unix time in milliseconds
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+def _iso(ns: int) -> str:
+    """
+    Format a ``time.time_ns()`` timestamp as a naive UTC ISO 8601 string
+    
+    Args:
+        ns: Nanoseconds since the epoch
+        
+    Returns:
+        The timestamp in the same format as ``datetime.utcnow().isoformat()``
+    """
+    return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+
+def _ns_from_iso(value: str) -> int:
+    """
+    Parse an ISO 8601 timestamp into nanoseconds since the epoch
+    
+    Args:
+        value: The timestamp, naive values are taken to be UTC
+        
+    Returns:
+        Nanoseconds since the epoch
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (parsed - _EPOCH) // timedelta(microseconds=1) * 1000
+
 
 class BaseDurableObject(ABC):
     """
@@ -30,8 +111,24 @@ class BaseDurableObject(ABC):
     Durable Objects are isolated, self-contained units of computation that
     maintain their own state and respond to requests. They are the backbone
     of the microservices architecture in AIDevOS.
+    
+    Instances use __slots__ to keep their footprint small, so subclasses
+    must declare __slots__ too, listing any instance attributes they add.
     """
     
+    __slots__ = (
+        "object_id", "project_id", "name", "state",
+        "_status", "_version", "_created_at", "_updated_at_ns", "_last_activity_ns",
+        "_event_handlers", "_subscribed_events", "_dirty", "_state_fingerprint"
+    )
+    
+    # Objects with unsaved state, keyed by object ID, awaiting the next flush
+    _pending_flushes: ClassVar[Dict[str, "BaseDurableObject"]] = {}
+    _flush_task: ClassVar[Optional["asyncio.Task[None]"]] = None
+    
+    # Request handler method names by action, per Durable Object class
+    _HANDLER_CACHE: ClassVar[Dict[type, Dict[str, str]]] = {}
+    
     def __init__(
         self,
         object_id: str,
@@ -54,11 +151,14 @@ class BaseDurableObject(ABC):
         self.state = state or {}
         self._status = "initializing"
         self._version = "1.0.0"
-        self._created_at = datetime.utcnow().isoformat()
-        self._updated_at = self._created_at
-        self._last_activity = self._created_at
-        self._event_handlers: Dict[str, List[Callable]] = {}
+        now_ns = time.time_ns()
+        self._created_at = _iso(now_ns)
+        self._updated_at_ns = now_ns
+        self._last_activity_ns = now_ns
+        self._event_handlers: Dict[str, Tuple[Callable, ...]] = {}
         self._subscribed_events: Set[str] = set()
+        self._dirty = False
+        self._state_fingerprint: Optional[int] = None
     
     @property
     def status(self) -> str:
@@ -68,10 +168,20 @@ class BaseDurableObject(ABC):
     @status.setter
     def status(self, value: str) -> None:
         """Set the status of this Durable Object"""
-        if value not in ["initializing", "active", "idle", "hibernating", "terminating"]:
+        if value not in _VALID_STATUSES:
             raise ValueError(f"Invalid status: {value}")
         self._status = value
-        self._updated_at = datetime.utcnow().isoformat()
+        self._updated_at_ns = time.time_ns()
+    
+    @property
+    def _updated_at(self) -> str:
+        """Get the time this Durable Object's status last changed as an ISO string"""
+        return _iso(self._updated_at_ns)
+    
+    @property
+    def _last_activity(self) -> str:
+        """Get the time this Durable Object last processed a request as an ISO string"""
+        return _iso(self._last_activity_ns)
     
     async def initialize(self) -> None:
         """
@@ -101,7 +211,7 @@ class BaseDurableObject(ABC):
         Returns:
             Response data from the action
         """
-        self._last_activity = datetime.utcnow().isoformat()
+        self._last_activity_ns = time.time_ns()
         
         # Update object status if it's hibernating
         if self._status == "hibernating":
@@ -109,20 +219,58 @@ class BaseDurableObject(ABC):
         elif self._status != "active":
             return {"error": f"Object is {self._status} and cannot process requests"}
         
+        # Resolve the handler for the action
+        handlers = self._HANDLER_CACHE.get(type(self))
+        if handlers is None:
+            handlers = type(self)._build_handler_table()
+        method_name = handlers.get(action)
+        if method_name is None:
+            return {"error": f"Unknown action: {action}"}
+        
         # Process the request
         try:
-            method_name = f"handle_{action}"
-            if hasattr(self, method_name) and callable(getattr(self, method_name)):
-                handler = getattr(self, method_name)
-                response = await handler(data, metadata)
-                await self._save_state()
-                return response
-            else:
-                return {"error": f"Unknown action: {action}"}
+            return await self._dispatch(method_name, data, metadata)
         except Exception as e:
             logger.error(f"Error processing request {action} for object {self.object_id}: {str(e)}")
             return {"error": str(e)}
     
+    async def _dispatch(
+        self,
+        method_name: str,
+        data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run a request handler and save the resulting state
+        
+        Args:
+            method_name: Name of the handler method to call
+            data: The data for the action
+            metadata: Optional metadata for the request
+            
+        Returns:
+            Response data from the handler, exceptions are propagated
+        """
+        response = await getattr(self, method_name)(data, metadata)
+        await self._save_state()
+        return response
+    
+    @classmethod
+    def _build_handler_table(cls) -> Dict[str, str]:
+        """
+        Build and cache the action to handler method name table for this class
+        
+        Returns:
+            Mapping of action names to ``handle_<action>`` method names
+        """
+        handlers = {
+            name[len("handle_"):]: name
+            for name in dir(cls)
+            if name.startswith("handle_") and callable(getattr(cls, name))
+        }
+        BaseDurableObject._HANDLER_CACHE[cls] = handlers
+        return handlers
+    
     async def hibernate(self) -> None:
         """
         Hibernate this Durable Object
@@ -131,7 +279,7 @@ class BaseDurableObject(ABC):
         It should clean up any resources that shouldn't persist while hibernating.
         """
         self.status = "hibernating"
-        await self._save_state()
+        await self.flush()
         logger.info(f"Durable Object {self.name} ({self.object_id}) hibernated")
     
     async def terminate(self) -> None:
@@ -142,12 +290,105 @@ class BaseDurableObject(ABC):
         It should clean up all resources and save any final state.
         """
         self.status = "terminating"
-        await self._save_state()
+        await self.flush()
         logger.info(f"Durable Object {self.name} ({self.object_id}) terminated")
     
     async def _save_state(self) -> None:
-        """Save the current state of this Durable Object to the data store"""
-        # Create or update the DurableObject record
+        """
+        Mark the current state of this Durable Object for persistence
+        
+        The write is deferred and coalesced with other pending writes; see
+        flush() for persisting immediately. Calls that leave the state and
+        status unchanged since the last save are skipped.
+        """
+        fingerprint = self._compute_fingerprint()
+        if fingerprint == self._state_fingerprint:
+            return
+        self._state_fingerprint = fingerprint
+        self._dirty = True
+        self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Queue this object for the next deferred flush, starting one if needed"""
+        cls = BaseDurableObject
+        cls._pending_flushes[self.object_id] = self
+        loop = asyncio.get_running_loop()
+        task = cls._flush_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            cls._flush_task = loop.create_task(cls._flush_pending())
+    
+    def _mark_unsaved(self) -> None:
+        """Mark the state as not persisted after a failed write"""
+        self._dirty = True
+        self._state_fingerprint = None
+    
+    async def flush(self, create: bool = False) -> None:
+        """
+        Write the current state of this Durable Object to the data store immediately
+        
+        Args:
+            create: Create the record if it does not exist yet; only set when
+                    persisting a newly created object
+        """
+        BaseDurableObject._pending_flushes.pop(self.object_id, None)
+        self._state_fingerprint = self._compute_fingerprint()
+        try:
+            await self._write_state(create)
+        except Exception:
+            self._mark_unsaved()
+            raise
+    
+    @staticmethod
+    async def _flush_pending() -> None:
+        """Write back all dirty Durable Objects after the flush interval"""
+        await asyncio.sleep(FLUSH_INTERVAL_MS / 1000)
+        
+        # Detach the batch so saves made while writing schedule a new flush
+        cls = BaseDurableObject
+        cls._flush_task = None
+        pending = [obj for obj in cls._pending_flushes.values() if obj._dirty]
+        cls._pending_flushes.clear()
+        
+        results = await asyncio.gather(
+            *(obj._write_state() for obj in pending),
+            return_exceptions=True
+        )
+        for obj, result in zip(pending, results):
+            if isinstance(result, Exception):
+                # Keep the state queued so the next flush retries the write
+                logger.error(f"Error flushing state for object {obj.object_id}: {str(result)}")
+                obj._mark_unsaved()
+                obj._schedule_flush()
+    
+    def _compute_fingerprint(self) -> int:
+        """Compute a fingerprint of the persisted state used to skip redundant writes"""
+        return hash(_dumps([self.state, self._status]))
+    
+    async def _write_state(self, create: bool = False) -> None:
+        """
+        Save the current state of this Durable Object to the data store
+        
+        Args:
+            create: Create the record if it does not exist yet. Otherwise a
+                    missing record means the object was deleted, and the
+                    write is dropped rather than bringing it back.
+        """
+        self._dirty = False
+        
+        # Update the changed fields of the existing record in place
+        changes = {
+            "state": self.state,
+            "status": self._status,
+            "version": self._version,
+            "last_activity": _iso(self._last_activity_ns)
+        }
+        if await durable_object_store.patch(self.object_id, changes) is not None:
+            return
+        if not create:
+            logger.warning(f"Dropping state write for deleted object {self.object_id}")
+            return
+        
+        # Create the DurableObject record on first save
         db_object = DurableObject(
             name=self.name,
             object_type=self.__class__.__name__,
@@ -158,22 +399,28 @@ class BaseDurableObject(ABC):
         )
         db_object.id = self.object_id
         db_object.created_at = self._created_at
-        db_object.updated_at = datetime.utcnow().isoformat()
-        db_object.last_activity = self._last_activity
-        
-        # Store the object in the data store
-        await durable_object_store.update(self.object_id, db_object)
+        db_object.last_activity = changes["last_activity"]
+        await durable_object_store.create(db_object)
     
     async def _load_state(self) -> None:
         """Load the state of this Durable Object from the data store"""
         db_object = await durable_object_store.read(self.object_id)
         if db_object:
-            self.state = db_object.state
-            self._status = db_object.status
-            self._version = db_object.version
-            self._created_at = db_object.created_at
-            self._updated_at = db_object.updated_at
-            self._last_activity = db_object.last_activity
+            self._apply_record(db_object)
+    
+    def _apply_record(self, db_object: DurableObject) -> None:
+        """
+        Restore the state of this Durable Object from a data store record
+        
+        Args:
+            db_object: The stored record for this object
+        """
+        self.state = db_object.state
+        self._status = db_object.status
+        self._version = db_object.version
+        self._created_at = db_object.created_at
+        self._updated_at_ns = _ns_from_iso(db_object.updated_at)
+        self._last_activity_ns = _ns_from_iso(db_object.last_activity)
     
     def subscribe_to_event(self, event_type: str) -> None:
         """
@@ -202,12 +449,17 @@ class BaseDurableObject(ABC):
             event_type: The type of event
             event_data: The event data
         """
-        if event_type in self._event_handlers:
-            for handler in self._event_handlers[event_type]:
-                try:
-                    await handler(event_data)
-                except Exception as e:
-                    logger.error(f"Error handling event {event_type} in object {self.object_id}: {str(e)}")
+        handlers = self._event_handlers.get(event_type)
+        if not handlers:
+            return
+        
+        results = await asyncio.gather(
+            *(handler(event_data) for handler in handlers),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error handling event {event_type} in object {self.object_id}: {str(result)}")
     
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """
@@ -217,9 +469,7 @@ class BaseDurableObject(ABC):
             event_type: The type of event to handle
             handler: The function to call when the event occurs
         """
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
-        self._event_handlers[event_type].append(handler)
+        self._event_handlers[event_type] = self._event_handlers.get(event_type, ()) + (handler,)
         # Automatically subscribe to this event type
         self.subscribe_to_event(event_type)
 
@@ -230,17 +480,31 @@ class DurableObjectRegistry:
     
     This class manages the registration of Durable Object types and
     keeps track of active Durable Object instances.
+    
+    Active instances are kept in a bounded LRU cache; the least recently
+    used object is hibernated and dropped once the cache is full. Lookups
+    for IDs missing from the data store are remembered for a short time.
     """
     
-    _instance = None
+    # Maximum number of active objects kept in memory
+    _MAX_ACTIVE = 4096
+    # Seconds a failed lookup is cached before the data store is queried again
+    _NEGATIVE_TTL = 5.0
+    # Seconds without requests after which an active object is hibernated
+    _IDLE_TTL = 300.0
+    # Seconds between sweeps for idle objects
+    _SWEEP_INTERVAL = 60.0
     
-    def __new__(cls):
-        """Ensure singleton instance"""
-        if cls._instance is None:
-            cls._instance = super(DurableObjectRegistry, cls).__new__(cls)
-            cls._instance._object_types: Dict[str, Type[BaseDurableObject]] = {}
-            cls._instance._active_objects: Dict[str, BaseDurableObject] = {}
-        return cls._instance
+    def __init__(self):
+        """Initialize a new registry; use the module-level ``registry`` instance"""
+        self._object_types: Dict[str, Type[BaseDurableObject]] = {}
+        self._active_objects: OrderedDict[str, BaseDurableObject] = OrderedDict()
+        self._negative: Dict[str, float] = {}
+        self._load_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._sweep_handle: Optional[asyncio.TimerHandle] = None
+        self._sweep_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Strong reference to the running sweep; the loop only keeps a weak one
+        self._sweep_task: Optional[asyncio.Task] = None
     
     def register_object_type(self, name: str, object_class: Type[BaseDurableObject]) -> None:
         """
@@ -251,6 +515,7 @@ class DurableObjectRegistry:
             object_class: Class of the Durable Object
         """
         self._object_types[name] = object_class
+        object_class._build_handler_table()
         logger.info(f"Registered Durable Object type: {name}")
     
     async def create_object(
@@ -276,7 +541,7 @@ class DurableObjectRegistry:
             raise ValueError(f"Unknown Durable Object type: {type_name}")
         
         # Create a new object
-        object_id = str(uuid.uuid4())
+        object_id = _uuid7()
         object_class = self._object_types[type_name]
         new_object = object_class(
             object_id=object_id,
@@ -285,11 +550,14 @@ class DurableObjectRegistry:
             state=initial_state or {}
         )
         
-        # Initialize the object
+        # Initialize the object and write its record right away so it is
+        # visible to lookups and listings before the deferred flush runs
         await new_object.initialize()
+        await new_object.flush(create=True)
         
         # Store in active objects
-        self._active_objects[object_id] = new_object
+        self._negative.pop(object_id, None)
+        await self._activate(object_id, new_object)
         
         logger.info(f"Created Durable Object: {name} ({object_id}) of type {type_name}")
         return object_id
@@ -305,21 +573,114 @@ class DurableObjectRegistry:
             The Durable Object if found, None otherwise
         """
         # Check if the object is already active
-        if object_id in self._active_objects:
-            return self._active_objects[object_id]
+        durable_object = self._active_objects.get(object_id)
+        if durable_object is not None:
+            self._active_objects.move_to_end(object_id)
+            return durable_object
+        
+        # Skip the data store for IDs recently found to be missing
+        expires_at = self._negative.get(object_id)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                return None
+            del self._negative[object_id]
+        
+        # Serialize loads of the same ID so concurrent misses share one read
+        lock = self._load_locks.get(object_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._load_locks[object_id] = lock
+        
+        async with lock:
+            durable_object = self._active_objects.get(object_id)
+            if durable_object is not None:
+                self._active_objects.move_to_end(object_id)
+                return durable_object
+            return await self._load_object(object_id)
+    
+    async def get_objects(self, object_ids: Sequence[str]) -> List[Optional[BaseDurableObject]]:
+        """
+        Get several Durable Objects by ID
+        
+        Objects that are not active are fetched from the data store with a
+        single bulk read.
+        
+        Args:
+            object_ids: IDs of the objects to get
+            
+        Returns:
+            The Durable Objects in the order of object_ids, None for IDs not found
+        """
+        now = time.monotonic()
+        found: Dict[str, Optional[BaseDurableObject]] = {}
+        misses = []
+        for object_id in object_ids:
+            durable_object = self._active_objects.get(object_id)
+            if durable_object is not None:
+                self._active_objects.move_to_end(object_id)
+                found[object_id] = durable_object
+                continue
+            expires_at = self._negative.get(object_id)
+            if expires_at is not None:
+                if expires_at > now:
+                    continue
+                del self._negative[object_id]
+            misses.append(object_id)
+        
+        if misses:
+            misses = list(dict.fromkeys(misses))
+            db_objects = await durable_object_store.read_many(misses)
+            for object_id, db_object in zip(misses, db_objects):
+                found[object_id] = await self._activate_record(object_id, db_object)
         
-        # Try to load from data store
+        return [found.get(object_id) for object_id in object_ids]
+    
+    async def _load_object(self, object_id: str) -> Optional[BaseDurableObject]:
+        """
+        Load a Durable Object from the data store and activate it
+        
+        Args:
+            object_id: ID of the object to load
+            
+        Returns:
+            The Durable Object if found, None otherwise
+        """
         db_object = await durable_object_store.read(object_id)
+        return await self._activate_record(object_id, db_object)
+    
+    async def _activate_record(
+        self,
+        object_id: str,
+        db_object: Optional[DurableObject]
+    ) -> Optional[BaseDurableObject]:
+        """
+        Rebuild a Durable Object from its data store record and activate it
+        
+        Args:
+            object_id: ID of the object
+            db_object: The stored record, None if the object was not found
+            
+        Returns:
+            The Durable Object if it could be restored, None otherwise
+        """
         if not db_object:
+            if len(self._negative) >= self._MAX_ACTIVE:
+                self._negative.clear()
+            self._negative[object_id] = time.monotonic() + self._NEGATIVE_TTL
             return None
         
+        # Another task may have activated the object while the record was read
+        durable_object = self._active_objects.get(object_id)
+        if durable_object is not None:
+            return durable_object
+        
         # Get the object type
         object_type = db_object.object_type
         if object_type not in self._object_types:
             logger.error(f"Unknown object type: {object_type} for object ID: {object_id}")
             return None
         
-        # Create and initialize the object
+        # Create the object and restore its state
         object_class = self._object_types[object_type]
         durable_object = object_class(
             object_id=object_id,
@@ -327,18 +688,88 @@ class DurableObjectRegistry:
             name=db_object.name,
             state=db_object.state
         )
+        durable_object._apply_record(db_object)
         
-        # Restore the object's state
-        await durable_object._load_state()
+        # Store in active objects
+        await self._activate(object_id, durable_object)
         
         # If the object was hibernating, initialize it
         if durable_object.status == "hibernating":
             await durable_object.initialize()
         
-        # Store in active objects
+        return durable_object
+    
+    async def _activate(self, object_id: str, durable_object: BaseDurableObject) -> None:
+        """
+        Add an object to the active objects, evicting the least recently used ones
+        
+        Args:
+            object_id: ID of the object
+            durable_object: The object to activate
+        """
         self._active_objects[object_id] = durable_object
+        self._active_objects.move_to_end(object_id)
+        self._schedule_sweep()
+        while len(self._active_objects) > self._MAX_ACTIVE:
+            evicted_id, evicted = self._active_objects.popitem(last=False)
+            try:
+                await evicted.hibernate()
+            except Exception as e:
+                logger.error(f"Error hibernating evicted object {evicted_id}: {str(e)}")
+    
+    def _schedule_sweep(self) -> None:
+        """Arm the idle object sweep on the running event loop if it is not armed yet"""
+        loop = asyncio.get_running_loop()
+        if self._sweep_handle is not None and self._sweep_loop is loop:
+            return
+        self._sweep_loop = loop
+        self._sweep_handle = loop.call_later(self._SWEEP_INTERVAL, self._run_sweep)
+    
+    def _run_sweep(self) -> None:
+        """Start a sweep for idle objects and re-arm it while objects are active"""
+        self._sweep_handle = None
+        if not self._active_objects:
+            return
+        self._sweep_task = self._sweep_loop.create_task(self.hibernate_idle_objects())
+        self._sweep_task.add_done_callback(self._sweep_done)
+        self._sweep_handle = self._sweep_loop.call_later(self._SWEEP_INTERVAL, self._run_sweep)
+    
+    def _sweep_done(self, task: asyncio.Task) -> None:
+        """Log a failed idle sweep and release the finished task"""
+        if self._sweep_task is task:
+            self._sweep_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error sweeping idle objects: {str(task.exception())}")
+    
+    async def hibernate_idle_objects(self) -> int:
+        """
+        Hibernate and deactivate all objects idle for longer than _IDLE_TTL
         
-        return durable_object
+        Returns:
+            Number of objects hibernated
+        """
+        cutoff_ns = time.time_ns() - int(self._IDLE_TTL * 1_000_000_000)
+        idle = [
+            (object_id, durable_object)
+            for object_id, durable_object in self._active_objects.items()
+            if durable_object._last_activity_ns < cutoff_ns
+            and durable_object.status in _HIBERNATABLE_STATUSES
+        ]
+        if not idle:
+            return 0
+        
+        for object_id, _ in idle:
+            del self._active_objects[object_id]
+        results = await asyncio.gather(
+            *(durable_object.hibernate() for _, durable_object in idle),
+            return_exceptions=True
+        )
+        for (object_id, _), result in zip(idle, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error hibernating idle object {object_id}: {str(result)}")
+        
+        logger.info(f"Hibernated {len(idle)} idle Durable Objects")
+        return len(idle)
     
     async def update_object(
         self,
@@ -409,23 +840,21 @@ class DurableObjectRegistry:
         Returns:
             List of Durable Object metadata
         """
-        # Define filter function
-        def filter_func(obj: DurableObject) -> bool:
-            if project_id and obj.project_id != project_id:
-                return False
-            if object_type and obj.object_type != object_type:
-                return False
-            if status and obj.status != status:
-                return False
-            return True
+        # Only filter on the criteria that were provided
+        filters = {}
+        if project_id:
+            filters["project_id"] = project_id
+        if object_type:
+            filters["object_type"] = object_type
+        if status:
+            filters["status"] = status
         
         # Get objects from data store
-        objects = await durable_object_store.list(filter_func)
+        objects = await durable_object_store.list(**filters)
         
         # Convert to metadata format
-        result = []
-        for obj in objects:
-            result.append({
+        return [
+            {
                 "id": obj.id,
                 "name": obj.name,
                 "type": obj.object_type,
@@ -435,9 +864,9 @@ class DurableObjectRegistry:
                 "created_at": obj.created_at,
                 "updated_at": obj.updated_at,
                 "last_activity": obj.last_activity
-            })
-        
-        return result
+            }
+            for obj in objects
+        ]
 
 
 class DurableObjectRouter:
@@ -492,52 +921,78 @@ class EventBus:
     Durable Objects, allowing them to react to events from other objects.
     """
     
-    _instance = None
-    
-    def __new__(cls):
-        """Ensure singleton instance"""
-        if cls._instance is None:
-            cls._instance = super(EventBus, cls).__new__(cls)
-            cls._instance._registry = DurableObjectRegistry()
-            cls._instance._subscriptions: Dict[str, Set[str]] = {}
-        return cls._instance
+    def __init__(self, registry: DurableObjectRegistry):
+        """
+        Initialize a new event bus; use the module-level ``event_bus`` instance
+        
+        Args:
+            registry: The Durable Object registry used to resolve subscribers
+        """
+        self._registry = registry
+        self._subscriptions: Dict[str, Set[str]] = {}
+        self._by_subscriber: Dict[str, Set[str]] = defaultdict(set)
     
     async def publish(
         self,
         event_type: str,
-        event_data: Dict[str, Any],
+        event_data: Optional[Mapping[str, Any]],
         source_id: Optional[str] = None
     ) -> None:
         """
         Publish an event to all subscribers
         
+        Subscribers receive the same read-only mapping, with a snapshot of
+        the event data under "data" and the event metadata under "metadata",
+        so handlers must copy it rather than mutate it. The read-only views
+        are not JSON-serializable as-is; handlers that serialize an event
+        should convert each part with dict() first.
+        
         Args:
             event_type: Type of the event
-            event_data: Event data
+            event_data: Event data; None is published as an empty mapping
             source_id: Optional ID of the source object
+            
+        Raises:
+            ValueError: If event_data is neither None nor a mapping
         """
+        if event_data is None:
+            event_data = {}
+        elif not isinstance(event_data, Mapping):
+            raise ValueError(f"Event data must be a mapping, got {type(event_data).__name__}")
+        
         if event_type not in self._subscriptions:
             # No subscribers for this event type
             return
         
-        # Add metadata to the event
-        event_with_metadata = {
-            "data": event_data,
-            "metadata": {
+        # Add metadata to the event; every subscriber shares one read-only view
+        event_with_metadata = MappingProxyType({
+            "data": MappingProxyType(dict(event_data)),
+            "metadata": MappingProxyType({
                 "event_type": event_type,
                 "timestamp": datetime.utcnow().isoformat(),
                 "source_id": source_id
-            }
-        }
+            })
+        })
         
-        # Deliver to all subscribers
-        for subscriber_id in self._subscriptions[event_type]:
-            try:
-                subscriber = await self._registry.get_object(subscriber_id)
-                if subscriber:
-                    await subscriber.handle_event(event_type, event_with_metadata)
-            except Exception as e:
-                logger.error(f"Error delivering event {event_type} to subscriber {subscriber_id}: {str(e)}")
+        # Resolve all subscribers, then deliver to them concurrently
+        subscriber_ids = list(self._subscriptions[event_type])
+        try:
+            subscribers = await self._registry.get_objects(subscriber_ids)
+        except Exception as e:
+            logger.error(f"Error resolving subscribers for event {event_type}: {str(e)}")
+            return
+        
+        deliveries = []
+        delivery_ids = []
+        for subscriber_id, subscriber in zip(subscriber_ids, subscribers):
+            if subscriber:
+                deliveries.append(subscriber.handle_event(event_type, event_with_metadata))
+                delivery_ids.append(subscriber_id)
+        
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        for subscriber_id, result in zip(delivery_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error delivering event {event_type} to subscriber {subscriber_id}: {str(result)}")
     
     def subscribe(self, object_id: str, event_type: str) -> None:
         """
@@ -550,6 +1005,7 @@ class EventBus:
         if event_type not in self._subscriptions:
             self._subscriptions[event_type] = set()
         self._subscriptions[event_type].add(object_id)
+        self._by_subscriber[object_id].add(event_type)
     
     def unsubscribe(self, object_id: str, event_type: Optional[str] = None) -> None:
         """
@@ -562,19 +1018,23 @@ class EventBus:
         """
         if event_type:
             # Unsubscribe from a specific event type
-            if event_type in self._subscriptions and object_id in self._subscriptions[event_type]:
-                self._subscriptions[event_type].remove(object_id)
+            if event_type in self._subscriptions:
+                self._subscriptions[event_type].discard(object_id)
+            event_types = self._by_subscriber.get(object_id)
+            if event_types is not None:
+                event_types.discard(event_type)
+                if not event_types:
+                    del self._by_subscriber[object_id]
         else:
-            # Unsubscribe from all event types
-            for event_subscriptions in self._subscriptions.values():
-                if object_id in event_subscriptions:
-                    event_subscriptions.remove(object_id)
+            # Unsubscribe from all event types this object subscribed to
+            for subscribed_type in self._by_subscriber.pop(object_id, ()):
+                self._subscriptions[subscribed_type].discard(object_id)
 
 
 # Create singleton instances
 registry = DurableObjectRegistry()
 router = DurableObjectRouter(registry)
-event_bus = EventBus()
+event_bus = EventBus(registry)
 
 
 # Define Durable Object lifecycle management functions
@@ -684,7 +1144,7 @@ async def send_request_to_object(
 
 async def publish_event(
     event_type: str,
-    event_data: Dict[str, Any],
+    event_data: Optional[Mapping[str, Any]],
     source_id: Optional[str] = None
 ) -> None:
     """
@@ -696,4 +1156,3 @@ async def publish_event(
         source_id: Optional ID of the source object
     """
     await event_bus.publish(event_type, event_data, source_id)
-"""
\ No newline at end of file
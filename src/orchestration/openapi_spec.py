@@ -5,21 +5,766 @@ This module generates an OpenAPI specification for the AIDevOS API,
 documenting all available endpoints, request/response formats, and authentication.
 """
 
+import argparse
+import asyncio
+import gzip
+import hashlib
 import json
-from typing import Dict, Any
+import os
+import shutil
+import sys
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    from jsonschema import Draft7Validator
+except ImportError:
+    Draft7Validator = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # OpenAPI specification version
 OPENAPI_VERSION = "3.0.0"
 
+# Pre-built specification shipped with the package, generated from _build_spec()
+SPEC_FILE = Path(__file__).with_name("openapi_spec.json")
+
+# The specification is loaded on first use unless this is set to "0", in which
+# case warmup() runs at import so no request pays the loading cost
+DEFER_BUILD = os.getenv("AIDEVOS_OPENAPI_DEFER_BUILD", "1") != "0"
+
+
+
+def _freeze(obj: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if memo is None:
+        memo = {}
+    if isinstance(obj, (dict, list)):
+        frozen = memo.get(id(obj))
+        if frozen is None:
+            if isinstance(obj, dict):
+                frozen = MappingProxyType({key: _freeze(value, memo) for key, value in obj.items()})
+            else:
+                frozen = tuple(_freeze(item, memo) for item in obj)
+            memo[id(obj)] = frozen
+        return frozen
+    return obj
+
+
+def _compact(obj: Any, shared: Dict[Any, Any]) -> Any:
+    """
+    Intern strings and collapse identical subtrees into shared objects
+    
+    Args:
+        obj: Loaded JSON value
+        shared: Canonical containers keyed by their contents
+        
+    Returns:
+        Equal value whose duplicate strings, dicts and lists are shared
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        value = {sys.intern(key): _compact(item, shared) for key, item in obj.items()}
+        signature = ("d",) + tuple((key, _signature(item)) for key, item in value.items())
+    elif isinstance(obj, list):
+        value = [_compact(item, shared) for item in obj]
+        signature = ("l",) + tuple(_signature(item) for item in value)
+    else:
+        return obj
+    return shared.setdefault(signature, value)
+
+
+def _signature(value: Any) -> Any:
+    """Identify an already-compacted value; shared containers compare by identity"""
+    if isinstance(value, (dict, list)):
+        return id(value)
+    return (type(value), value)
+
+
+# Local subset of the OpenAPI 3.0 schema covering the structure this module emits
+_OPENAPI_SCHEMA = {
+    "type": "object",
+    "required": ["openapi", "info", "paths"],
+    "properties": {
+        "openapi": {"type": "string", "pattern": "^3\\.0\\.\\d+$"},
+        "info": {
+            "type": "object",
+            "required": ["title", "version"],
+            "properties": {"title": {"type": "string"}, "version": {"type": "string"}}
+        },
+        "servers": {
+            "type": "array",
+            "items": {"type": "object", "required": ["url"]}
+        },
+        "components": {"type": "object"},
+        "paths": {
+            "type": "object",
+            "propertyNames": {"pattern": "^/"},
+            "additionalProperties": {
+                "type": "object",
+                "propertyNames": {"enum": ["get", "put", "post", "delete", "options", "head", "patch", "trace"]},
+                "additionalProperties": {
+                    "type": "object",
+                    "required": ["responses"],
+                    "properties": {
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                        "parameters": {
+                            "type": "array",
+                            "items": {"type": "object", "required": ["name", "in"]}
+                        },
+                        "responses": {"type": "object", "minProperties": 1}
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Compiled once; None when jsonschema is not installed
+_VALIDATOR = Draft7Validator(_OPENAPI_SCHEMA) if Draft7Validator is not None else None
+
+
+def _iter_refs(obj: Any):
+    """Yield every $ref value in a specification tree"""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "$ref":
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            yield from _iter_refs(item)
+
+
+def validate_spec(spec: Dict[str, Any]) -> None:
+    """
+    Validate the structure of an OpenAPI specification
+    
+    Checks the document against a local schema (when jsonschema is
+    installed) and that every local $ref points at an existing component.
+    The loaded specification is validated once, not per request.
+    
+    Args:
+        spec: OpenAPI specification to validate
+        
+    Raises:
+        ValueError: If the specification is invalid
+    """
+    if _VALIDATOR is not None:
+        error = next(iter(_VALIDATOR.iter_errors(spec)), None)
+        if error is not None:
+            location = "/".join(str(part) for part in error.absolute_path)
+            raise ValueError(f"Invalid OpenAPI specification at /{location}: {error.message}")
+    
+    for ref in set(_iter_refs(spec)):
+        node = spec
+        for part in ref.lstrip("#/").split("/"):
+            node = node.get(part) if isinstance(node, dict) else None
+            if node is None:
+                raise ValueError(f"Unresolved reference in OpenAPI specification: {ref}")
+
+
+# The specification is static, so it is loaded, serialized and hashed once per
+# process; every accessor below is memoized with lru_cache(maxsize=1)
+@lru_cache(maxsize=1)
+def _load_spec() -> Dict[str, Any]:
+    """Load SPEC_FILE and return the plain dictionary used for serialization"""
+    data = SPEC_FILE.read_bytes()
+    spec = orjson.loads(data) if orjson is not None else json.loads(data)
+    if __debug__:
+        validate_spec(spec)
+    return _compact(spec, {})
 
-def generate_openapi_spec() -> Dict[str, Any]:
+
+@lru_cache(maxsize=1)
+def generate_openapi_spec() -> Mapping[str, Any]:
     """
     Generate the OpenAPI specification for AIDevOS
     
+    The specification is loaded from SPEC_FILE on the first call and a
+    read-only view of it is shared by every caller afterwards.
+    
     Returns:
-        OpenAPI specification as a dictionary
+        OpenAPI specification as a read-only mapping
+    """
+    return _freeze(_load_spec())
+
+
+@lru_cache(maxsize=1)
+def endpoint_keys() -> FrozenSet[Tuple[str, str]]:
+    """
+    Get every (path, method) pair documented in the specification
+    
+    Returns:
+        Frozen set of (path, lowercase method) tuples for O(1) membership tests
+    """
+    return frozenset(
+        (path, method)
+        for path, item in _load_spec()["paths"].items()
+        for method in item
+    )
+
+
+@lru_cache(maxsize=1)
+def generate_openapi_spec_json() -> bytes:
+    """
+    Get the OpenAPI specification serialized as compact JSON
+    
+    The bytes are produced on the first call and cached, so handlers
+    serving the specification can write them out directly.
+    
+    Returns:
+        UTF-8 encoded JSON of the OpenAPI specification
+    """
+    return _dumps(_load_spec())
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize a value as compact UTF-8 JSON
+    
+    Uses orjson, then ujson, then the standard library; all three produce
+    the same bytes, so the ETag does not depend on which one is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def iter_openapi_spec_json() -> Iterator[bytes]:
+    """
+    Serialize the OpenAPI specification incrementally
+    
+    Yields the document without "paths", then one chunk per path item,
+    then the closing braces. Only one path item is serialized at a time,
+    so the complete body is never held in memory.
+    
+    Yields:
+        Consecutive pieces of the compact JSON specification
+    """
+    spec = _load_spec()
+    head = {key: value for key, value in spec.items() if key != "paths"}
+    yield _dumps(head)[:-1] + (b',"paths":{' if head else b'"paths":{')
+    for index, (path, item) in enumerate(spec["paths"].items()):
+        yield (b"," if index else b"") + _dumps(path) + b":" + _dumps(item)
+    yield b"}}"
+
+
+async def stream_openapi_spec(writer: asyncio.StreamWriter) -> None:
     """
-    spec = {
+    Write the OpenAPI specification to a stream chunk by chunk
+    
+    Args:
+        writer: Stream to write the compact JSON specification to
+    """
+    for chunk in iter_openapi_spec_json():
+        writer.write(chunk)
+        await writer.drain()
+
+
+@lru_cache(maxsize=1)
+def generate_openapi_spec_json_gz() -> bytes:
+    """
+    Get the compact JSON specification compressed with gzip
+    
+    The body is compressed once at maximum level with a fixed mtime, so
+    it is stable across processes and can be sent without per-request work.
+    
+    Returns:
+        Gzip-compressed JSON of the OpenAPI specification
+    """
+    return gzip.compress(generate_openapi_spec_json(), compresslevel=9, mtime=0)
+
+
+@lru_cache(maxsize=1)
+def spec_etag() -> str:
+    """
+    Get the HTTP entity tag of the serialized OpenAPI specification
+    
+    Returns:
+        Quoted strong ETag derived from the SHA-256 of the compact JSON
+    """
+    return '"' + hashlib.sha256(generate_openapi_spec_json()).hexdigest()[:16] + '"'
+
+
+@lru_cache(maxsize=1)
+def spec_last_modified() -> str:
+    """
+    Get the HTTP Last-Modified date of the OpenAPI specification
+    
+    Returns:
+        Modification time of SPEC_FILE as an HTTP date
+    """
+    return formatdate(SPEC_FILE.stat().st_mtime, usegmt=True)
+
+
+@lru_cache(maxsize=None)
+def get_compiled_validator(path: str, method: str) -> Callable[[Any], Any]:
+    """
+    Get a validator for the JSON request body of an operation
+    
+    The body schema is compiled once per operation, with fastjsonschema
+    when installed and jsonschema otherwise, and the validator is reused
+    for every request.
+    
+    Args:
+        path: Path as it appears in the specification, e.g. "/auth/login"
+        method: Lowercase HTTP method
+        
+    Returns:
+        Callable that returns the data if valid and raises ValueError otherwise
+        
+    Raises:
+        KeyError: If the operation does not exist or takes no JSON body
+        RuntimeError: If neither fastjsonschema nor jsonschema is installed
+    """
+    spec = _load_spec()
+    body = spec["paths"][path][method]["requestBody"]
+    # Keep components alongside the body so local $refs resolve
+    schema = {
+        "allOf": [body["content"]["application/json"]["schema"]],
+        "components": spec["components"]
+    }
+    
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    
+    if Draft7Validator is None:
+        raise RuntimeError("Request validation requires fastjsonschema or jsonschema")
+    validator = Draft7Validator(schema)
+    
+    def validate(data: Any) -> Any:
+        error = next(iter(validator.iter_errors(data)), None)
+        if error is not None:
+            raise ValueError(error.message)
+        return data
+    
+    return validate
+
+
+def warmup() -> None:
+    """
+    Load, serialize and compress the OpenAPI specification ahead of time
+    
+    Long-running services can call this at startup so the first request
+    for the specification is served from the caches.
+    """
+    generate_openapi_spec()
+    endpoint_keys()
+    spec_etag()
+    spec_last_modified()
+    generate_openapi_spec_json_gz()
+
+
+def clear_spec_cache() -> None:
+    """Drop the cached specification and builder output so the next access reloads SPEC_FILE"""
+    for accessor in (
+        _load_spec, generate_openapi_spec, endpoint_keys, generate_openapi_spec_json,
+        generate_openapi_spec_json_gz, spec_etag, spec_last_modified,
+        generate_spec_skeleton, generate_path_spec, _path_items, _endpoints
+    ):
+        accessor.cache_clear()
+    get_compiled_validator.cache_clear()
+
+
+def spec_not_modified(if_none_match: Optional[str]) -> bool:
+    """
+    Check whether a client's cached copy of the specification is current
+    
+    Args:
+        if_none_match: Value of the request's If-None-Match header, if any
+        
+    Returns:
+        True if the handler can answer with 304 Not Modified
+    """
+    if not if_none_match:
+        return False
+    etag = spec_etag()
+    return any(
+        tag.strip() in (etag, "*", "W/" + etag)
+        for tag in if_none_match.split(",")
+    )
+
+
+def openapi_spec_response(
+    accept_encoding: Optional[str] = None,
+    if_none_match: Optional[str] = None
+) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Build the HTTP response for serving the OpenAPI specification
+    
+    Args:
+        accept_encoding: Value of the request's Accept-Encoding header, if any
+        if_none_match: Value of the request's If-None-Match header, if any
+        
+    Returns:
+        Tuple of status code, response headers and body
+    """
+    headers = {
+        "Content-Type": "application/json",
+        "ETag": spec_etag(),
+        "Last-Modified": spec_last_modified(),
+        "Vary": "Accept-Encoding"
+    }
+    if spec_not_modified(if_none_match):
+        return 304, headers, b""
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return 200, headers, generate_openapi_spec_json_gz()
+    return 200, headers, generate_openapi_spec_json()
+
+
+# Schema fragments shared by reference wherever they recur in the specification
+_ERROR_REF = {"$ref": "#/components/schemas/Error"}
+_ERROR_CONTENT = {"application/json": {"schema": _ERROR_REF}}
+_USER_REF = {"$ref": "#/components/schemas/User"}
+_SUCCESS_MESSAGE_REF = {"$ref": "#/components/schemas/SuccessMessage"}
+_UNAUTHORIZED = {"$ref": "#/components/responses/Unauthorized"}
+_FORBIDDEN = {"$ref": "#/components/responses/Forbidden"}
+_USER_NOT_FOUND = {"$ref": "#/components/responses/UserNotFound"}
+_BEARER_AUTH = [{"bearerAuth": []}]
+_STRING = {"type": "string"}
+_UUID = {"type": "string", "format": "uuid"}
+_SUCCESS = {"type": "boolean", "description": "Whether the request was successful"}
+_MESSAGE = {"type": "string", "description": "Success message"}
+_EMAIL = {"type": "string", "format": "email", "description": "Email address"}
+_CREATED_AT = {"type": "string", "format": "date-time", "description": "Creation timestamp"}
+_PROJECT_ID = {"type": "string", "format": "uuid", "description": "Project ID"}
+_OBJECT_STATUSES = ("initializing", "active", "idle", "hibernating", "terminating")
+_USER_ID_PARAM = {
+    "name": "user_id",
+    "in": "path",
+    "description": "User ID",
+    "required": True,
+    "schema": _UUID
+}
+
+
+def _prop(type_: str, description: str, **extra: Any) -> Dict[str, Any]:
+    """Build a described property schema; extra keywords go before the description"""
+    return {"type": type_, **extra, "description": description}
+
+
+def _object(properties: Dict[str, Any], *required: str) -> Dict[str, Any]:
+    """Build an object schema from its properties and required names"""
+    schema = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = list(required)
+    return schema
+
+
+def _json_content(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a schema as an application/json content map"""
+    return {"application/json": {"schema": schema}}
+
+
+def _error(description: str) -> Dict[str, Any]:
+    """Build an inline error response with the shared Error schema"""
+    return {"description": description, "content": _ERROR_CONTENT}
+
+
+# Error responses that operations can list by status code alone
+_STANDARD_ERRORS = {
+    401: _UNAUTHORIZED,
+    403: _FORBIDDEN,
+    404: _USER_NOT_FOUND,
+}
+
+
+def _success_message(success_description: str) -> Dict[str, Any]:
+    """Reference SuccessMessage, keeping an operation-specific description of its success flag"""
+    return {"allOf": [
+        _SUCCESS_MESSAGE_REF,
+        {"properties": {"success": {"description": success_description}}}
+    ]}
+
+
+def _op(
+    summary: str,
+    description: str,
+    tags: List[str],
+    req: Optional[Dict[str, Any]] = None,
+    resp: Optional[Dict[str, Any]] = None,
+    resp_description: str = "Successful response",
+    errors: Sequence[Any] = (401, 403, 404),
+    security: Optional[List[Dict[str, List[str]]]] = _BEARER_AUTH,
+    params: Sequence[Dict[str, Any]] = ()
+) -> Dict[str, Any]:
+    """
+    Assemble an operation object from its parts
+    
+    Args:
+        summary: Operation summary
+        description: Operation description
+        tags: Operation tags
+        req: Schema of the JSON request body, if any
+        resp: Schema of the successful JSON response
+        resp_description: Description of the successful response
+        errors: Status codes from _STANDARD_ERRORS or (code, response) pairs
+        security: Security requirements, or None for public operations
+        params: Operation parameters
+        
+    Returns:
+        OpenAPI operation object
+    """
+    op = {"summary": summary, "description": description, "tags": tags}
+    if security is not None:
+        op["security"] = security
+    if params:
+        op["parameters"] = list(params)
+    if req is not None:
+        op["requestBody"] = {"required": True, "content": _json_content(req)}
+    responses = {"200": {"description": resp_description, "content": _json_content(resp)}}
+    for error in errors:
+        if isinstance(error, int):
+            responses[str(error)] = _STANDARD_ERRORS[error]
+        else:
+            code, response = error
+            responses[str(code)] = response
+    op["responses"] = responses
+    return op
+
+
+_AUTH = ["Authentication"]
+_USERS = ["Users"]
+_DURABLE_OBJECTS = ["Durable Objects"]
+_DATA_STORAGE = ["Data Storage"]
+
+@lru_cache(maxsize=1)
+def _endpoints() -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Build every operation in the specification as (path, method, operation)
+    
+    The table is only needed to regenerate SPEC_FILE or build mini-specs,
+    so it is constructed on first use rather than at import.
+    
+    Returns:
+        Endpoint table in specification order
+    """
+    return [
+        # Authentication endpoints
+        ("/auth/login", "post", _op(
+            "Login to the system",
+            "Authenticate with username and password to get access tokens",
+            _AUTH,
+            req={"$ref": "#/components/schemas/LoginRequest"},
+            resp={"$ref": "#/components/schemas/LoginResponse"},
+            resp_description="Successful login",
+            errors=[(401, _error("Invalid credentials"))],
+            security=None
+        )),
+        ("/auth/register", "post", _op(
+            "Register a new user",
+            "Create a new user account",
+            _AUTH,
+            req=_object({
+                "username": _prop("string", "Username"),
+                "email": _EMAIL,
+                "password": _prop("string", "Password", format="password"),
+                "first_name": _prop("string", "First name"),
+                "last_name": _prop("string", "Last name")
+            }, "username", "email", "password"),
+            resp=_object({
+                "success": _prop("boolean", "Whether the registration was successful"),
+                "message": _MESSAGE,
+                "user_id": _prop("string", "ID of the created user", format="uuid")
+            }, "success", "message", "user_id"),
+            resp_description="Successful registration",
+            errors=[(400, _error("Invalid registration data"))],
+            security=None
+        )),
+        ("/auth/refresh", "post", _op(
+            "Refresh access token",
+            "Get a new access token using a refresh token",
+            _AUTH,
+            req=_object({
+                "refresh_token": _prop("string", "Refresh token")
+            }, "refresh_token"),
+            resp=_object({
+                "success": _prop("boolean", "Whether the refresh was successful"),
+                "access_token": _prop("string", "New JWT access token")
+            }, "success", "access_token"),
+            resp_description="Successful token refresh",
+            errors=[(401, _error("Invalid refresh token"))],
+            security=None
+        )),
+        ("/auth/logout", "post", _op(
+            "Logout from the system",
+            "Invalidate the current access token",
+            _AUTH,
+            resp=_success_message("Whether the logout was successful"),
+            resp_description="Successful logout",
+            errors=(401,)
+        )),
+    
+        # User endpoints
+        ("/users", "get", _op(
+            "List users",
+            "Get a list of users in the system (admin only)",
+            _USERS,
+            params=[
+                {"name": "role", "in": "query", "description": "Filter by role", "schema": _STRING},
+                {
+                    "name": "active_only",
+                    "in": "query",
+                    "description": "Only include active users",
+                    "schema": {"type": "boolean", "default": True}
+                }
+            ],
+            resp=_object({
+                "success": _SUCCESS,
+                "users": _prop("array", "List of users", items=_USER_REF),
+                "total": _prop("integer", "Total number of users")
+            }, "success", "users", "total"),
+            resp_description="List of users",
+            errors=(401, 403)
+        )),
+        ("/users/{user_id}", "get", _op(
+            "Get user",
+            "Get a user by ID",
+            _USERS,
+            params=[_USER_ID_PARAM],
+            resp=_object({"success": _SUCCESS, "user": _USER_REF}, "success", "user"),
+            resp_description="User details"
+        )),
+        ("/users/{user_id}", "put", _op(
+            "Update user",
+            "Update a user's profile",
+            _USERS,
+            params=[_USER_ID_PARAM],
+            req=_object({
+                "updates": _object({
+                    "first_name": _prop("string", "First name"),
+                    "last_name": _prop("string", "Last name"),
+                    "email": _EMAIL,
+                    "password": _prop("string", "New password", format="password"),
+                    "settings": _prop("object", "User settings")
+                })
+            }, "updates"),
+            resp=_success_message("Whether the update was successful"),
+            resp_description="User updated"
+        )),
+    
+        # Durable Objects endpoints
+        ("/durable-objects", "get", _op(
+            "List Durable Objects",
+            "Get a list of Durable Objects in the system (admin only)",
+            _DURABLE_OBJECTS,
+            params=[
+                {"name": "project_id", "in": "query", "description": "Filter by project ID", "schema": _UUID},
+                {"name": "object_type", "in": "query", "description": "Filter by object type", "schema": _STRING},
+                {
+                    "name": "status",
+                    "in": "query",
+                    "description": "Filter by status",
+                    "schema": {"type": "string", "enum": list(_OBJECT_STATUSES)}
+                }
+            ],
+            resp=_object({
+                "success": _SUCCESS,
+                "objects": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/DurableObject"},
+                    "description": "List of Durable Objects"
+                },
+                "total": _prop("integer", "Total number of objects")
+            }, "success", "objects", "total"),
+            resp_description="List of Durable Objects",
+            errors=(401, 403)
+        )),
+        ("/durable-objects", "post", _op(
+            "Create Durable Object",
+            "Create a new Durable Object (admin only)",
+            _DURABLE_OBJECTS,
+            req=_object({
+                "type_name": _prop("string", "Type of Durable Object to create"),
+                "project_id": _PROJECT_ID,
+                "name": _prop("string", "Object name"),
+                "initial_state": _prop("object", "Initial state for the object")
+            }, "type_name", "project_id", "name"),
+            resp=_object({
+                "success": _prop("boolean", "Whether the creation was successful"),
+                "object_id": _prop("string", "ID of the created object", format="uuid"),
+                "message": _MESSAGE
+            }, "success", "object_id", "message"),
+            resp_description="Object created",
+            errors=(401, 403, (400, _error("Invalid request")))
+        )),
+    
+        # Data storage endpoints
+        ("/data/collections", "get", _op(
+            "List collections",
+            "Get a list of data collections",
+            _DATA_STORAGE,
+            security=[{"bearerAuth": []}, {"apiKeyAuth": []}],
+            resp=_object({
+                "success": _SUCCESS,
+                "collections": {
+                    "type": "array",
+                    "items": _object({
+                        "name": _prop("string", "Collection name"),
+                        "item_count": _prop("integer", "Number of items in the collection")
+                    }, "name", "item_count"),
+                    "description": "List of collections"
+                },
+                "total": _prop("integer", "Total number of collections")
+            }, "success", "collections", "total"),
+            resp_description="List of collections",
+            errors=(401,)
+        )),
+    ]
+
+
+def _render_spec() -> bytes:
+    """Build, validate and render the specification exactly as stored in SPEC_FILE"""
+    spec = _build_spec()
+    validate_spec(spec)
+    if orjson is not None:
+        return orjson.dumps(spec, option=orjson.OPT_INDENT_2) + b"\n"
+    # Matches orjson's output: two-space indent, UTF-8 rather than \u escapes
+    return (json.dumps(spec, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_spec_file() -> None:
+    """Rebuild the OpenAPI specification and write it to SPEC_FILE"""
+    SPEC_FILE.write_bytes(_render_spec())
+    clear_spec_cache()
+
+
+def check_spec_file() -> bool:
+    """
+    Check that SPEC_FILE matches the specification built from this module
+    
+    Returns:
+        True if the file is up to date, False if it is missing or stale
+    """
+    return SPEC_FILE.is_file() and SPEC_FILE.read_bytes() == _render_spec()
+
+
+@lru_cache(maxsize=None)
+def _spec_skeleton() -> Dict[str, Any]:
+    """Build the parts of the OpenAPI specification shared by every path"""
+    return {
         "openapi": OPENAPI_VERSION,
         "info": {
             "title": "AIDevOS API",
@@ -64,939 +809,208 @@ def generate_openapi_spec() -> Dict[str, Any]:
                     "description": "API key obtained from the system administrator"
                 }
             },
-            "schemas": {
-                "Error": {
-                    "type": "object",
-                    "properties": {
-                        "error": {
-                            "type": "string",
-                            "description": "Error message"
-                        },
-                        "status_code": {
-                            "type": "integer",
-                            "description": "HTTP status code"
-                        }
-                    },
-                    "required": ["error"]
-                },
-                "User": {
-                    "type": "object",
-                    "properties": {
-                        "id": {
-                            "type": "string",
-                            "format": "uuid",
-                            "description": "User ID"
-                        },
-                        "username": {
-                            "type": "string",
-                            "description": "Username"
-                        },
-                        "email": {
-                            "type": "string",
-                            "format": "email",
-                            "description": "Email address"
-                        },
-                        "roles": {
-                            "type": "array",
-                            "items": {
-                                "type": "string"
-                            },
-                            "description": "User roles"
-                        },
-                        "first_name": {
-                            "type": "string",
-                            "description": "First name"
-                        },
-                        "last_name": {
-                            "type": "string",
-                            "description": "Last name"
-                        },
-                        "created_at": {
-                            "type": "string",
-                            "format": "date-time",
-                            "description": "Creation timestamp"
-                        },
-                        "is_active": {
-                            "type": "boolean",
-                            "description": "Whether the user is active"
-                        }
-                    },
-                    "required": ["id", "username", "email", "roles"]
-                },
-                "Project": {
-                    "type": "object",
-                    "properties": {
-                        "id": {
-                            "type": "string",
-                            "format": "uuid",
-                            "description": "Project ID"
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Project name"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Project description"
-                        },
-                        "owner_id": {
-                            "type": "string",
-                            "format": "uuid",
-                            "description": "Owner user ID"
-                        },
-                        "created_at": {
-                            "type": "string",
-                            "format": "date-time",
-                            "description": "Creation timestamp"
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["active", "archived", "deleted"],
-                            "description": "Project status"
-                        }
-                    },
-                    "required": ["id", "name", "owner_id", "status"]
-                },
-                "DurableObject": {
-                    "type": "object",
-                    "properties": {
-                        "id": {
-                            "type": "string",
-                            "format": "uuid",
-                            "description": "Object ID"
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Object name"
-                        },
-                        "type": {
-                            "type": "string",
-                            "description": "Object type"
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "format": "uuid",
-                            "description": "Project ID"
-                        },
-                        "status": {
-                            "type": "string",
-                            "enum": ["initializing", "active", "idle", "hibernating", "terminating"],
-                            "description": "Object status"
-                        },
-                        "created_at": {
-                            "type": "string",
-                            "format": "date-time",
-                            "description": "Creation timestamp"
-                        },
-                        "updated_at": {
-                            "type": "string",
-                            "format": "date-time",
-                            "description": "Last update timestamp"
-                        },
-                        "last_activity": {
-                            "type": "string",
-                            "format": "date-time",
-                            "description": "Last activity timestamp"
-                        }
-                    },
-                    "required": ["id", "name", "type", "project_id", "status"]
-                },
-                "LoginRequest": {
-                    "type": "object",
-                    "properties": {
-                        "username": {
-                            "type": "string",
-                            "description": "Username"
-                        },
-                        "password": {
-                            "type": "string",
-                            "format": "password",
-                            "description": "Password"
-                        }
-                    },
-                    "required": ["username", "password"]
-                },
-                "LoginResponse": {
-                    "type": "object",
-                    "properties": {
-                        "success": {
-                            "type": "boolean",
-                            "description": "Whether the login was successful"
-                        },
-                        "access_token": {
-                            "type": "string",
-                            "description": "JWT access token"
-                        },
-                        "refresh_token": {
-                            "type": "string",
-                            "description": "JWT refresh token"
-                        },
-                        "user": {
-                            "$ref": "#/components/schemas/User"
-                        }
-                    },
-                    "required": ["success", "access_token", "refresh_token", "user"]
-                }
-            }
-        },
-        "paths": {
-            # Authentication endpoints
-            "/auth/login": {
-                "post": {
-                    "summary": "Login to the system",
-                    "description": "Authenticate with username and password to get access tokens",
-                    "tags": ["Authentication"],
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "$ref": "#/components/schemas/LoginRequest"
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Successful login",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/LoginResponse"
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Invalid credentials",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/auth/register": {
-                "post": {
-                    "summary": "Register a new user",
-                    "description": "Create a new user account",
-                    "tags": ["Authentication"],
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "username": {
-                                            "type": "string",
-                                            "description": "Username"
-                                        },
-                                        "email": {
-                                            "type": "string",
-                                            "format": "email",
-                                            "description": "Email address"
-                                        },
-                                        "password": {
-                                            "type": "string",
-                                            "format": "password",
-                                            "description": "Password"
-                                        },
-                                        "first_name": {
-                                            "type": "string",
-                                            "description": "First name"
-                                        },
-                                        "last_name": {
-                                            "type": "string",
-                                            "description": "Last name"
-                                        }
-                                    },
-                                    "required": ["username", "email", "password"]
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Successful registration",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the registration was successful"
-                                            },
-                                            "message": {
-                                                "type": "string",
-                                                "description": "Success message"
-                                            },
-                                            "user_id": {
-                                                "type": "string",
-                                                "format": "uuid",
-                                                "description": "ID of the created user"
-                                            }
-                                        },
-                                        "required": ["success", "message", "user_id"]
-                                    }
-                                }
-                            }
-                        },
-                        "400": {
-                            "description": "Invalid registration data",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/auth/refresh": {
-                "post": {
-                    "summary": "Refresh access token",
-                    "description": "Get a new access token using a refresh token",
-                    "tags": ["Authentication"],
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "refresh_token": {
-                                            "type": "string",
-                                            "description": "Refresh token"
-                                        }
-                                    },
-                                    "required": ["refresh_token"]
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Successful token refresh",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the refresh was successful"
-                                            },
-                                            "access_token": {
-                                                "type": "string",
-                                                "description": "New JWT access token"
-                                            }
-                                        },
-                                        "required": ["success", "access_token"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Invalid refresh token",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/auth/logout": {
-                "post": {
-                    "summary": "Logout from the system",
-                    "description": "Invalidate the current access token",
-                    "tags": ["Authentication"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Successful logout",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the logout was successful"
-                                            },
-                                            "message": {
-                                                "type": "string",
-                                                "description": "Success message"
-                                            }
-                                        },
-                                        "required": ["success", "message"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            
-            # User endpoints
-            "/users": {
-                "get": {
-                    "summary": "List users",
-                    "description": "Get a list of users in the system (admin only)",
-                    "tags": ["Users"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "parameters": [
-                        {
-                            "name": "role",
-                            "in": "query",
-                            "description": "Filter by role",
-                            "schema": {
-                                "type": "string"
-                            }
-                        },
-                        {
-                            "name": "active_only",
-                            "in": "query",
-                            "description": "Only include active users",
-                            "schema": {
-                                "type": "boolean",
-                                "default": True
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "List of users",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the request was successful"
-                                            },
-                                            "users": {
-                                                "type": "array",
-                                                "items": {
-                                                    "$ref": "#/components/schemas/User"
-                                                },
-                                                "description": "List of users"
-                                            },
-                                            "total": {
-                                                "type": "integer",
-                                                "description": "Total number of users"
-                                            }
-                                        },
-                                        "required": ["success", "users", "total"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "403": {
-                            "description": "Forbidden",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            "/users/{user_id}": {
-                "get": {
-                    "summary": "Get user",
-                    "description": "Get a user by ID",
-                    "tags": ["Users"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "parameters": [
-                        {
-                            "name": "user_id",
-                            "in": "path",
-                            "description": "User ID",
-                            "required": True,
-                            "schema": {
-                                "type": "string",
-                                "format": "uuid"
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "User details",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the request was successful"
-                                            },
-                                            "user": {
-                                                "$ref": "#/components/schemas/User"
-                                            }
-                                        },
-                                        "required": ["success", "user"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "403": {
-                            "description": "Forbidden",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "404": {
-                            "description": "User not found",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
+            "responses": {
+                "Unauthorized": {
+                    "description": "Unauthorized",
+                    "content": _ERROR_CONTENT
                 },
-                "put": {
-                    "summary": "Update user",
-                    "description": "Update a user's profile",
-                    "tags": ["Users"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "parameters": [
-                        {
-                            "name": "user_id",
-                            "in": "path",
-                            "description": "User ID",
-                            "required": True,
-                            "schema": {
-                                "type": "string",
-                                "format": "uuid"
-                            }
-                        }
-                    ],
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "updates": {
-                                            "type": "object",
-                                            "properties": {
-                                                "first_name": {
-                                                    "type": "string",
-                                                    "description": "First name"
-                                                },
-                                                "last_name": {
-                                                    "type": "string",
-                                                    "description": "Last name"
-                                                },
-                                                "email": {
-                                                    "type": "string",
-                                                    "format": "email",
-                                                    "description": "Email address"
-                                                },
-                                                "password": {
-                                                    "type": "string",
-                                                    "format": "password",
-                                                    "description": "New password"
-                                                },
-                                                "settings": {
-                                                    "type": "object",
-                                                    "description": "User settings"
-                                                }
-                                            }
-                                        }
-                                    },
-                                    "required": ["updates"]
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "User updated",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the update was successful"
-                                            },
-                                            "message": {
-                                                "type": "string",
-                                                "description": "Success message"
-                                            }
-                                        },
-                                        "required": ["success", "message"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "403": {
-                            "description": "Forbidden",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "404": {
-                            "description": "User not found",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            
-            # Durable Objects endpoints
-            "/durable-objects": {
-                "get": {
-                    "summary": "List Durable Objects",
-                    "description": "Get a list of Durable Objects in the system (admin only)",
-                    "tags": ["Durable Objects"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "parameters": [
-                        {
-                            "name": "project_id",
-                            "in": "query",
-                            "description": "Filter by project ID",
-                            "schema": {
-                                "type": "string",
-                                "format": "uuid"
-                            }
-                        },
-                        {
-                            "name": "object_type",
-                            "in": "query",
-                            "description": "Filter by object type",
-                            "schema": {
-                                "type": "string"
-                            }
-                        },
-                        {
-                            "name": "status",
-                            "in": "query",
-                            "description": "Filter by status",
-                            "schema": {
-                                "type": "string",
-                                "enum": ["initializing", "active", "idle", "hibernating", "terminating"]
-                            }
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "List of Durable Objects",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the request was successful"
-                                            },
-                                            "objects": {
-                                                "type": "array",
-                                                "items": {
-                                                    "$ref": "#/components/schemas/DurableObject"
-                                                },
-                                                "description": "List of Durable Objects"
-                                            },
-                                            "total": {
-                                                "type": "integer",
-                                                "description": "Total number of objects"
-                                            }
-                                        },
-                                        "required": ["success", "objects", "total"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "403": {
-                            "description": "Forbidden",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
+                "Forbidden": {
+                    "description": "Forbidden",
+                    "content": _ERROR_CONTENT
                 },
-                "post": {
-                    "summary": "Create Durable Object",
-                    "description": "Create a new Durable Object (admin only)",
-                    "tags": ["Durable Objects"],
-                    "security": [
-                        {"bearerAuth": []}
-                    ],
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "type_name": {
-                                            "type": "string",
-                                            "description": "Type of Durable Object to create"
-                                        },
-                                        "project_id": {
-                                            "type": "string",
-                                            "format": "uuid",
-                                            "description": "Project ID"
-                                        },
-                                        "name": {
-                                            "type": "string",
-                                            "description": "Object name"
-                                        },
-                                        "initial_state": {
-                                            "type": "object",
-                                            "description": "Initial state for the object"
-                                        }
-                                    },
-                                    "required": ["type_name", "project_id", "name"]
-                                }
-                            }
-                        }
-                    },
-                    "responses": {
-                        "200": {
-                            "description": "Object created",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the creation was successful"
-                                            },
-                                            "object_id": {
-                                                "type": "string",
-                                                "format": "uuid",
-                                                "description": "ID of the created object"
-                                            },
-                                            "message": {
-                                                "type": "string",
-                                                "description": "Success message"
-                                            }
-                                        },
-                                        "required": ["success", "object_id", "message"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "403": {
-                            "description": "Forbidden",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        },
-                        "400": {
-                            "description": "Invalid request",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
+                "UserNotFound": {
+                    "description": "User not found",
+                    "content": _ERROR_CONTENT
                 }
             },
-            
-            # Data storage endpoints
-            "/data/collections": {
-                "get": {
-                    "summary": "List collections",
-                    "description": "Get a list of data collections",
-                    "tags": ["Data Storage"],
-                    "security": [
-                        {"bearerAuth": []},
-                        {"apiKeyAuth": []}
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "List of collections",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {
-                                            "success": {
-                                                "type": "boolean",
-                                                "description": "Whether the request was successful"
-                                            },
-                                            "collections": {
-                                                "type": "array",
-                                                "items": {
-                                                    "type": "object",
-                                                    "properties": {
-                                                        "name": {
-                                                            "type": "string",
-                                                            "description": "Collection name"
-                                                        },
-                                                        "item_count": {
-                                                            "type": "integer",
-                                                            "description": "Number of items in the collection"
-                                                        }
-                                                    },
-                                                    "required": ["name", "item_count"]
-                                                },
-                                                "description": "List of collections"
-                                            },
-                                            "total": {
-                                                "type": "integer",
-                                                "description": "Total number of collections"
-                                            }
-                                        },
-                                        "required": ["success", "collections", "total"]
-                                    }
-                                }
-                            }
-                        },
-                        "401": {
-                            "description": "Unauthorized",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "$ref": "#/components/schemas/Error"
-                                    }
-                                }
-                            }
-                        }
-                    }
-                }
+            "schemas": {
+                "Error": _object({
+                    "error": _prop("string", "Error message"),
+                    "status_code": _prop("integer", "HTTP status code")
+                }, "error"),
+                "User": _object({
+                    "id": _prop("string", "User ID", format="uuid"),
+                    "username": _prop("string", "Username"),
+                    "email": _EMAIL,
+                    "roles": _prop("array", "User roles", items=_STRING),
+                    "first_name": _prop("string", "First name"),
+                    "last_name": _prop("string", "Last name"),
+                    "created_at": _CREATED_AT,
+                    "is_active": _prop("boolean", "Whether the user is active")
+                }, "id", "username", "email", "roles"),
+                "Project": _object({
+                    "id": _PROJECT_ID,
+                    "name": _prop("string", "Project name"),
+                    "description": _prop("string", "Project description"),
+                    "owner_id": _prop("string", "Owner user ID", format="uuid"),
+                    "created_at": _CREATED_AT,
+                    "status": _prop("string", "Project status", enum=["active", "archived", "deleted"])
+                }, "id", "name", "owner_id", "status"),
+                "DurableObject": _object({
+                    "id": _prop("string", "Object ID", format="uuid"),
+                    "name": _prop("string", "Object name"),
+                    "type": _prop("string", "Object type"),
+                    "project_id": _PROJECT_ID,
+                    "status": _prop("string", "Object status", enum=list(_OBJECT_STATUSES)),
+                    "created_at": _CREATED_AT,
+                    "updated_at": _prop("string", "Last update timestamp", format="date-time"),
+                    "last_activity": _prop("string", "Last activity timestamp", format="date-time")
+                }, "id", "name", "type", "project_id", "status"),
+                "LoginRequest": _object({
+                    "username": _prop("string", "Username"),
+                    "password": _prop("string", "Password", format="password")
+                }, "username", "password"),
+                "LoginResponse": _object({
+                    "success": _prop("boolean", "Whether the login was successful"),
+                    "access_token": _prop("string", "JWT access token"),
+                    "refresh_token": _prop("string", "JWT refresh token"),
+                    "user": _USER_REF
+                }, "success", "access_token", "refresh_token", "user"),
+                "SuccessMessage": _object({"success": _SUCCESS, "message": _MESSAGE}, "success", "message")
             }
         }
     }
+
+
+@lru_cache(maxsize=None)
+def _path_items() -> Dict[str, Dict[str, Any]]:
+    """Group the endpoint table into path items in a single pass"""
+    paths: Dict[str, Dict[str, Any]] = {}
+    for path, method, op in _endpoints():
+        # Operations of a path may be listed apart; merge them into one item
+        paths.setdefault(path, {})[method] = op
+    return paths
+
+
+def _path_spec(path: str) -> Dict[str, Any]:
+    """Get the path item for a single path"""
+    try:
+        return _path_items()[path]
+    except KeyError:
+        raise KeyError(f"Unknown path: {path}") from None
+
+
+@lru_cache(maxsize=None)
+def generate_spec_skeleton() -> Mapping[str, Any]:
+    """
+    Generate the OpenAPI specification without its paths
+    
+    Returns:
+        Read-only OpenAPI specification without paths
+    """
+    return _freeze(_spec_skeleton())
+
+
+@lru_cache(maxsize=None)
+def generate_path_spec(path: str) -> Mapping[str, Any]:
+    """
+    Generate a specification covering a single path
+    
+    Only the requested path item is built, which suits per-endpoint
+    validators and renderers that do not need the whole specification.
+    
+    Args:
+        path: Path as it appears in the specification, e.g. "/users/{user_id}"
+        
+    Returns:
+        Read-only OpenAPI specification containing only the given path
+        
+    Raises:
+        KeyError: If the path is not part of the specification
+    """
+    return _freeze({**_spec_skeleton(), "paths": {path: _path_spec(path)}})
+
+
+def _build_spec() -> Dict[str, Any]:
+    """
+    Build the OpenAPI specification for AIDevOS
     
-    return spec
+    This is the source of SPEC_FILE; run write_spec_file() after changing it.
+    
+    Returns:
+        OpenAPI specification as a dictionary
+    """
+    return {**_spec_skeleton(), "paths": _path_items()}
 
 
 def save_openapi_spec(output_path: str) -> None:
     """
     Generate and save the OpenAPI specification to a file
     
+    SPEC_FILE already holds the indented serialization, so it is copied
+    as-is instead of re-encoding the specification.
+    
     Args:
         output_path: Path to save the specification to
     """
-    spec = generate_openapi_spec()
-    with open(output_path, "w") as f:
-        json.dump(spec, f, indent=2)
+    shutil.copyfile(SPEC_FILE, output_path)
     print(f"OpenAPI specification saved to {output_path}")
 
 
+if not DEFER_BUILD:
+    warmup()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse, defaults to sys.argv
+        
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="AIDevOS OpenAPI Specification Generator")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help=f"Exit with an error if {SPEC_FILE.name} is out of date",
+    )
+    mode.add_argument(
+        "--write",
+        action="store_true",
+        help=f"Regenerate {SPEC_FILE.name} from the builder",
+    )
+    mode.add_argument(
+        "--output",
+        type=str,
+        default="openapi.json",
+        help="Path to save the specification to, or - for stdout",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point.
+    
+    Args:
+        argv: Command line arguments, defaults to sys.argv
+        
+    Returns:
+        Exit code
+    """
+    args = parse_args(argv)
+    
+    if args.check:
+        if check_spec_file():
+            return 0
+        print(f"{SPEC_FILE} is out of date; run with --write to regenerate it", file=sys.stderr)
+        return 1
+    
+    if args.write:
+        write_spec_file()
+        print(f"OpenAPI specification written to {SPEC_FILE}")
+        return 0
+    
+    if args.output == "-":
+        sys.stdout.buffer.write(_render_spec())
+    else:
+        save_openapi_spec(args.output)
+    return 0
+
+
 if __name__ == "__main__":
-    save_openapi_spec("openapi.json")
-"""
\ No newline at end of file
+    sys.exit(main())
@@ -6,6 +6,7 @@ This script initializes and runs the AIDevOS agent system for development and te
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import os
@@ -27,26 +28,41 @@ logger = logging.getLogger('aidevos')
 from agents.base_agent import BaseAgent
 from agents.pm_agent import PMAgent
 
+# Task message ids only need to be unique within this process
+_task_ids = itertools.count(1)
+
+
+class _LazyJSON:
+    """Log argument that is only serialized if the record is emitted."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self):
+        return json.dumps(self.obj, indent=2)
+
 
 async def demo_communication():
     """Demonstrate basic agent communication."""
     # Create our agents
     pm_agent = PMAgent(f"pm_{uuid.uuid4().hex[:8]}")
-    logger.info(f"Created PM Agent: {pm_agent}")
+    logger.info("Created PM Agent: %s", pm_agent)
     
     # Start the PM agent
     logger.info("Starting PM Agent...")
     pm_task = asyncio.create_task(pm_agent.start())
     
-    # Wait a moment for the agent to start
-    await asyncio.sleep(1)
+    # Both tasks are created together, so they share one timestamp
+    timestamp = datetime.utcnow().isoformat()
     
     # Create a feature planning task
     feature_task = {
-        "message_id": f"task_{uuid.uuid4().hex}",
+        "message_id": f"task_{next(_task_ids):x}",
         "sender": "user",
         "recipient": pm_agent.agent_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp,
         "message_type": "task",
         "content": {
             "task_type": "feature_planning",
@@ -56,19 +72,12 @@ async def demo_communication():
         }
     }
     
-    # Send the task to the PM agent
-    logger.info(f"Sending feature planning task to PM Agent: {feature_task['content']['feature_name']}")
-    await pm_agent.receive_message(feature_task)
-    
-    # Wait a moment for the task to be processed
-    await asyncio.sleep(1)
-    
     # Create an architecture decision task
     adr_task = {
-        "message_id": f"task_{uuid.uuid4().hex}",
+        "message_id": f"task_{next(_task_ids):x}",
         "sender": "user",
         "recipient": pm_agent.agent_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp,
         "message_type": "task",
         "content": {
             "task_type": "architecture_decision",
@@ -80,25 +89,33 @@ async def demo_communication():
         }
     }
     
-    # Send the task to the PM agent
-    logger.info(f"Sending architecture decision task to PM Agent: {adr_task['content']['title']}")
-    await pm_agent.receive_message(adr_task)
+    # The tasks are independent, so send both at once; the agent's FIFO
+    # queue still processes them in this order
+    logger.info("Sending feature planning task to PM Agent: %s", feature_task['content']['feature_name'])
+    logger.info("Sending architecture decision task to PM Agent: %s", adr_task['content']['title'])
+    await asyncio.gather(
+        pm_agent.receive_message(feature_task),
+        pm_agent.receive_message(adr_task)
+    )
     
-    # Wait a moment for the task to be processed
-    await asyncio.sleep(1)
+    # Wait until the agent has processed both tasks
+    await pm_agent.task_queue.join()
     
     # Get the current roadmap
     roadmap = pm_agent.get_current_roadmap()
-    logger.info(f"Current roadmap: {json.dumps(roadmap, indent=2)}")
+    logger.info("Current roadmap: %s", _LazyJSON(roadmap))
     
     # Get the architecture decisions
     decisions = pm_agent.get_architecture_decisions()
-    logger.info(f"Architecture decisions: {json.dumps(decisions, indent=2)}")
+    logger.info("Architecture decisions: %s", _LazyJSON(decisions))
     
     # Stop the PM agent
     logger.info("Stopping PM Agent...")
-    pm_agent.running = False
-    await pm_task
+    await pm_agent.stop()
+    try:
+        await pm_task
+    except asyncio.CancelledError:
+        pass
 
 
 async def main():
@@ -11,7 +11,10 @@ import logging
 import os
 import sys
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Callable, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +25,104 @@ logging.basicConfig(
 logger = logging.getLogger("aidevos.devops_agent")
 
 
+# Task modules are heavy, so each is imported on first use and the result is
+# cached for the other tasks of the same run
+@lru_cache(maxsize=None)
+def _deployment_module() -> Tuple[type, type, type]:
+    """Import the deployment classes."""
+    from src.deployment.deploy import DeploymentManager, DeploymentEnvironment, DeploymentStrategy
+    return DeploymentManager, DeploymentEnvironment, DeploymentStrategy
+
+
+@lru_cache(maxsize=None)
+def _run_test_suite() -> Callable[..., int]:
+    """Import the test runner."""
+    from src.testing.run_tests import run_test_suite
+    return run_test_suite
+
+
+@lru_cache(maxsize=None)
+def _monitoring_module() -> Tuple[type, type, type]:
+    """Import the monitoring classes."""
+    from src.monitoring.setup import MonitoringSetup, MonitoringEnvironment, MonitoringComponent
+    return MonitoringSetup, MonitoringEnvironment, MonitoringComponent
+
+
+@lru_cache(maxsize=None)
+def _self_improvement_engine() -> type:
+    """Import the self-improvement engine class."""
+    from src.deployment.self_improvement import SelfImprovementEngine
+    return SelfImprovementEngine
+
+
+@lru_cache(maxsize=None)
+def _generate_default_workflows() -> Callable[[], Any]:
+    """Import the GitHub Actions workflow generator."""
+    from src.deployment.ci_cd.github_actions import generate_default_workflows
+    return generate_default_workflows
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_cls: type) -> Dict[str, Any]:
+    """Map the values of an enum to its members."""
+    return {member.value: member for member in enum_cls}
+
+
+def _enum_member(enum_cls: type, value: str) -> Any:
+    """
+    Look up an enum member by value.
+    
+    Args:
+        enum_cls: Enum class to look in
+        value: Value of the member
+        
+    Returns:
+        The matching enum member
+        
+    Raises:
+        ValueError: If no member has the given value
+    """
+    members = _enum_values(enum_cls)
+    try:
+        return members[value]
+    except KeyError:
+        raise ValueError(
+            f"Unknown {enum_cls.__name__} '{value}', expected one of: {', '.join(members)}"
+        ) from None
+
+
+@dataclass(frozen=True)
+class TaskPaths:
+    """Filesystem locations used by the DevOps tasks, derived once per run."""
+    
+    monitoring_config_dir: str
+    monitoring_output_dir: str
+    self_improvement_config: str
+
+
+def build_paths(args: argparse.Namespace) -> TaskPaths:
+    """
+    Derive the task paths from the command-line arguments.
+    
+    Args:
+        args: Command-line arguments
+        
+    Returns:
+        Paths for the monitoring and self-improvement tasks
+    """
+    return TaskPaths(
+        monitoring_config_dir=os.path.dirname(args.config) if args.config else "config/monitoring",
+        monitoring_output_dir=f"deployment/monitoring/{args.environment}",
+        self_improvement_config=args.config or "config/self_improvement.json",
+    )
+
+
+def _task_paths(args: argparse.Namespace) -> TaskPaths:
+    """Get the paths computed in main(), or derive them for direct callers."""
+    paths = getattr(args, "paths", None)
+    return paths if paths is not None else build_paths(args)
+
+
 def parse_args() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -89,14 +190,14 @@ def run_deployment(args: argparse.Namespace) -> bool:
     Returns:
         True if deployment was successful, False otherwise
     """
-    logger.info(f"Running deployment to {args.environment} environment")
+    logger.info("Running deployment to %s environment", args.environment)
     
     try:
-        from src.deployment.deploy import DeploymentManager, DeploymentEnvironment, DeploymentStrategy
+        DeploymentManager, DeploymentEnvironment, DeploymentStrategy = _deployment_module()
         
         # Create deployment manager
         manager = DeploymentManager(
-            environment=DeploymentEnvironment(args.environment),
+            environment=_enum_member(DeploymentEnvironment, args.environment),
             strategy=DeploymentStrategy.BLUE_GREEN,
             config_path=args.config,
         )
@@ -110,7 +211,7 @@ def run_deployment(args: argparse.Namespace) -> bool:
             return False
     
     except Exception as e:
-        logger.error(f"Error during deployment: {str(e)}")
+        logger.error("Error during deployment: %s", e)
         return False
 
 
@@ -124,26 +225,18 @@ def run_tests(args: argparse.Namespace) -> bool:
     Returns:
         True if tests passed, False otherwise
     """
-    logger.info(f"Running tests in {args.environment} environment")
+    logger.info("Running tests in %s environment", args.environment)
     
     try:
-        from src.testing.run_tests import main as run_tests_main
-        
-        # Set up test arguments
-        test_args = ["--environment", args.environment]
-        
-        if args.component:
-            test_args.extend(["--component", args.component])
-        
-        if args.verbose:
-            test_args.append("--verbose")
-        
-        if args.quiet:
-            test_args.append("--quiet")
+        run_test_suite = _run_test_suite()
         
         # Run tests
-        sys.argv = [sys.argv[0]] + test_args
-        result = run_tests_main()
+        result = run_test_suite(
+            environment=args.environment,
+            component=args.component,
+            verbose=args.verbose,
+            quiet=args.quiet,
+        )
         
         # Check result
         if result == 0:
@@ -154,7 +247,7 @@ def run_tests(args: argparse.Namespace) -> bool:
             return False
     
     except Exception as e:
-        logger.error(f"Error during testing: {str(e)}")
+        logger.error("Error during testing: %s", e)
         return False
 
 
@@ -168,21 +261,23 @@ def run_monitoring(args: argparse.Namespace) -> bool:
     Returns:
         True if monitoring was set up successfully, False otherwise
     """
-    logger.info(f"Running monitoring for {args.environment} environment")
+    logger.info("Running monitoring for %s environment", args.environment)
     
     try:
-        from src.monitoring.setup import MonitoringSetup, MonitoringEnvironment, MonitoringComponent
+        MonitoringSetup, MonitoringEnvironment, MonitoringComponent = _monitoring_module()
+        
+        paths = _task_paths(args)
         
         # Create monitoring setup
         setup = MonitoringSetup(
-            environment=MonitoringEnvironment(args.environment),
-            config_dir=os.path.dirname(args.config) if args.config else "config/monitoring",
-            output_dir=f"deployment/monitoring/{args.environment}",
+            environment=_enum_member(MonitoringEnvironment, args.environment),
+            config_dir=paths.monitoring_config_dir,
+            output_dir=paths.monitoring_output_dir,
         )
         
         # Set up monitoring
         if args.component:
-            component = MonitoringComponent(args.component)
+            component = _enum_member(MonitoringComponent, args.component)
             success = setup.setup_component(component)
         else:
             success = setup.setup_monitoring_stack()
@@ -195,7 +290,7 @@ def run_monitoring(args: argparse.Namespace) -> bool:
             return False
     
     except Exception as e:
-        logger.error(f"Error during monitoring setup: {str(e)}")
+        logger.error("Error during monitoring setup: %s", e)
         return False
 
 
@@ -212,11 +307,11 @@ def run_improvement(args: argparse.Namespace) -> bool:
     logger.info("Running self-improvement analysis")
     
     try:
-        from src.deployment.self_improvement import SelfImprovementEngine
+        SelfImprovementEngine = _self_improvement_engine()
         
         # Create self-improvement engine
         engine = SelfImprovementEngine(
-            config_path=args.config or "config/self_improvement.json",
+            config_path=_task_paths(args).self_improvement_config,
         )
         
         # Analyze system
@@ -224,20 +319,20 @@ def run_improvement(args: argparse.Namespace) -> bool:
         
         # Print optimizations
         if optimizations:
-            logger.info(f"Found {len(optimizations)} potential optimizations:")
+            logger.info("Found %d potential optimizations:", len(optimizations))
             for opt in optimizations:
-                logger.info(f"- [{opt['priority'].upper()}] {opt['description']}")
+                logger.info("- [%s] %s", opt['priority'].upper(), opt['description'])
         else:
             logger.info("No optimizations found")
         
         # Apply automatic optimizations
         applied_count = engine.apply_automatic_optimizations()
-        logger.info(f"Applied {applied_count} automatic optimizations")
+        logger.info("Applied %d automatic optimizations", applied_count)
         
         return True
     
     except Exception as e:
-        logger.error(f"Error during self-improvement analysis: {str(e)}")
+        logger.error("Error during self-improvement analysis: %s", e)
         return False
 
 
@@ -254,7 +349,7 @@ def run_ci(args: argparse.Namespace) -> bool:
     logger.info("Running CI tasks")
     
     try:
-        from src.deployment.ci_cd.github_actions import generate_default_workflows
+        generate_default_workflows = _generate_default_workflows()
         
         # Generate GitHub Actions workflows
         generate_default_workflows()
@@ -267,7 +362,7 @@ def run_ci(args: argparse.Namespace) -> bool:
         return True
     
     except Exception as e:
-        logger.error(f"Error during CI tasks: {str(e)}")
+        logger.error("Error during CI tasks: %s", e)
         return False
 
 
@@ -296,7 +391,7 @@ def run_cd(args: argparse.Namespace) -> bool:
         return True
     
     except Exception as e:
-        logger.error(f"Error during CD tasks: {str(e)}")
+        logger.error("Error during CD tasks: %s", e)
         return False
 
 
@@ -312,16 +407,13 @@ def run_all_tasks(args: argparse.Namespace) -> bool:
     """
     logger.info("Running all DevOps & QA tasks")
     
-    results = []
-    
-    # Run CI
-    results.append(run_ci(args))
-    
-    # Run CD
-    results.append(run_cd(args))
-    
-    # Run improvement
-    results.append(run_improvement(args))
+    # CI runs pytest in this process, and pytest's output capture and import
+    # changes affect every thread, so it runs alone. Self-improvement analysis
+    # does not depend on CD, so the two overlap once CI has finished.
+    results = [run_ci(args)]
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        improvement = executor.submit(run_improvement, args)
+        results += [run_cd(args), improvement.result()]
     
     # Check results
     return all(results)
@@ -335,6 +427,7 @@ def main() -> int:
         Exit code (0 for success, non-zero for failure)
     """
     args = parse_args()
+    args.paths = build_paths(args)
     
     # Set log level
     if args.verbose:
@@ -343,7 +436,7 @@ def main() -> int:
         logging.getLogger().setLevel(logging.WARNING)
     
     logger.info("Starting AIDevOS DevOps & QA Agent")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     success = False
     
@@ -364,8 +457,8 @@ def main() -> int:
         success = run_all_tasks(args)
     
     # Log summary
-    duration = time.time() - start_time
-    logger.info(f"DevOps & QA Agent completed in {duration:.2f} seconds")
+    duration = time.perf_counter() - start_time
+    logger.info("DevOps & QA Agent completed in %.2f seconds", duration)
     
     # Return appropriate exit code
     return 0 if success else 1
@@ -3,11 +3,48 @@ AIDevOS Authentication Module
 This module handles user authentication and authorization for the AIDevOS system.
 """
 
+import copy
 import os
 import time
-import jwt
+import hashlib
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
+
+# JWT implementation: "pyjwt" (default) or the opt-in "jwt_rs", a
+# PyJWT-compatible API with a native HS256 implementation that is not in
+# requirements.txt
+JWT_BACKEND = os.getenv("JWT_BACKEND", "pyjwt")
+
+
+def _load_jwt_backend(name: str) -> Tuple[Any, type]:
+    """
+    Import the JWT implementation selected by JWT_BACKEND
+    
+    Args:
+        name: Backend name, "pyjwt" or "jwt_rs"
+        
+    Returns:
+        Tuple of (backend module, base exception class for rejected tokens)
+        
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the backend is not installed or has no PyJWTError
+    """
+    if name == "pyjwt":
+        import jwt as backend
+    elif name == "jwt_rs":
+        import jwt_rs as backend
+    else:
+        raise ValueError(f"Unknown JWT_BACKEND {name!r}; expected 'pyjwt' or 'jwt_rs'")
+    
+    error = getattr(backend, "PyJWTError", None)
+    if not (isinstance(error, type) and issubclass(error, Exception)):
+        raise ImportError(f"JWT backend {name!r} does not provide PyJWTError")
+    return backend, error
+
+
+jwt, _JWTError = _load_jwt_backend(JWT_BACKEND)
 
 # Secret key for JWT token generation and validation
 # In production, this should be loaded from a secure environment variable
@@ -15,6 +52,39 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "dev-secret-key")
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Verified token payloads, keyed by a digest of the raw token and kept until
+# the token's own "exp" claim. Only successfully verified tokens are stored,
+# and payloads are deep-copied in and out so callers can't alter the cache.
+TOKEN_CACHE_MAX_SIZE = 10000
+_token_cache: Dict[bytes, Tuple[Dict[str, Any], float]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Return a fixed-size cache key for a raw token string"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _cache_payload(key: bytes, payload: Dict[str, Any]) -> None:
+    """Store a verified payload until its expiry claim"""
+    expiry = payload.get("exp")
+    if not isinstance(expiry, (int, float)):
+        return
+    now = time.time()
+    with _token_cache_lock:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            for stale in [k for k, (_, exp) in _token_cache.items() if exp <= now]:
+                del _token_cache[stale]
+            if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+                _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = (payload, float(expiry))
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token payloads"""
+    with _token_cache_lock:
+        _token_cache.clear()
+
 
 class AuthenticationManager:
     """Manages authentication for the AIDevOS system"""
@@ -31,18 +101,34 @@ class AuthenticationManager:
         Returns:
             JWT token string
         """
-        to_encode = data.copy()
-        
         if expires_delta:
             expire = datetime.utcnow() + expires_delta
         else:
             expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
             
-        to_encode.update({"exp": expire})
+        to_encode = {**data, "exp": expire}
         encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
         
         return encoded_jwt
     
+    @staticmethod
+    def create_access_token_fast(sub: str, roles: list, ttl: int = ACCESS_TOKEN_EXPIRE_MINUTES * 60) -> str:
+        """
+        Create a JWT access token for a subject and its roles
+        
+        Builds the claims inline instead of copying a caller-provided dict.
+        
+        Args:
+            sub: Subject the token is issued for
+            roles: Roles granted to the subject
+            ttl: Token lifetime in seconds
+            
+        Returns:
+            JWT token string
+        """
+        claims = {"sub": sub, "roles": roles, "exp": int(time.time()) + ttl}
+        return jwt.encode(claims, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    
     @staticmethod
     def verify_token(token: str) -> Optional[Dict[str, Any]]:
         """
@@ -54,11 +140,23 @@ class AuthenticationManager:
         Returns:
             The decoded token payload if valid, None otherwise
         """
+        key = _token_cache_key(token)
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        if cached is not None:
+            payload, expiry = cached
+            if time.time() < expiry:
+                return copy.deepcopy(payload)
+            with _token_cache_lock:
+                _token_cache.pop(key, None)
+        
         try:
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-            return payload
-        except jwt.PyJWTError:
+        except _JWTError:
             return None
+        
+        _cache_payload(key, copy.deepcopy(payload))
+        return payload
 
 
 class AuthorizationManager:
@@ -71,9 +169,11 @@ class AuthorizationManager:
         
         Args:
             user_roles: List of roles assigned to the user
-            required_roles: List of roles required for the operation
+            required_roles: Roles required for the operation (a set or frozenset is used as-is)
             
         Returns:
             True if the user has at least one of the required roles, False otherwise
         """
-        return any(role in required_roles for role in user_roles)
\ No newline at end of file
+        if not isinstance(required_roles, (set, frozenset)):
+            required_roles = set(required_roles)
+        return not required_roles.isdisjoint(user_roles)
\ No newline at end of file
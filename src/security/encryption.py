@@ -5,43 +5,95 @@ This module handles data encryption and protection for the AIDevOS system.
 
 import os
 import base64
+import hashlib
+from functools import lru_cache
 from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:
+    pbkdf2_hmac = hashlib.pbkdf2_hmac
 
 # Encryption key used by Fernet
 # In production, this should be loaded from a secure environment variable
 ENCRYPTION_KEY = os.getenv("ENCRYPTION_KEY")
 
+# PBKDF2 work factor. Derivation cost scales linearly with it (roughly 14us,
+# 127us, 1.5ms and 11ms for 100, 1000, 10000 and 100000 iterations), so only
+# lower it, through the iterations argument of generate_key, for internal
+# callers that derive keys per request and can accept weaker brute-force
+# resistance. The PBKDF2_ITERATIONS environment variable can only raise the
+# default, and must stay fixed for a deployment: the same password and salt
+# derive a different key under a different count, so data encrypted with
+# keys derived before a change can no longer be decrypted.
+MIN_PBKDF2_ITERATIONS = 100000
+
+
+def _iterations_from_env() -> int:
+    """
+    Read the default PBKDF2 iteration count from PBKDF2_ITERATIONS
+    
+    Returns:
+        The configured iteration count, or MIN_PBKDF2_ITERATIONS if unset
+        
+    Raises:
+        ValueError: If the value is not an integer or is below the minimum
+    """
+    value = os.getenv("PBKDF2_ITERATIONS")
+    if value is None:
+        return MIN_PBKDF2_ITERATIONS
+    try:
+        iterations = int(value)
+    except ValueError:
+        raise ValueError(f"PBKDF2_ITERATIONS must be an integer, got {value!r}") from None
+    if iterations < MIN_PBKDF2_ITERATIONS:
+        raise ValueError(
+            f"PBKDF2_ITERATIONS must be at least {MIN_PBKDF2_ITERATIONS}, got {iterations}"
+        )
+    return iterations
+
+
+PBKDF2_ITERATIONS = _iterations_from_env()
+
+
+@lru_cache(maxsize=32)
+def _fernet(key: bytes) -> Fernet:
+    """Return a cached Fernet instance for a key"""
+    return Fernet(key)
+
+
+def _fernet_for(key: bytes = None) -> Fernet:
+    """Return the Fernet instance for a key, falling back to ENCRYPTION_KEY"""
+    if key is None:
+        if ENCRYPTION_KEY is None:
+            raise ValueError("Encryption key not provided and not found in environment")
+        key = ENCRYPTION_KEY.encode()
+    return _fernet(key)
+
 
 class EncryptionManager:
     """Manages data encryption and decryption for the AIDevOS system"""
     
     @staticmethod
-    def generate_key(password: str, salt: bytes = None) -> bytes:
+    def generate_key(password: str, salt: bytes = None, iterations: int = None) -> bytes:
         """
         Generate an encryption key from a password using PBKDF2
         
         Args:
             password: Password to derive the key from
             salt: Optional salt for key derivation
+            iterations: Optional PBKDF2 iteration count (defaults to PBKDF2_ITERATIONS)
             
         Returns:
             Encryption key
         """
         if salt is None:
             salt = os.urandom(16)
+        if iterations is None:
+            iterations = PBKDF2_ITERATIONS
             
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-            backend=default_backend()
-        )
-        
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        derived = pbkdf2_hmac("sha256", password.encode(), salt, iterations, 32)
+        key = base64.urlsafe_b64encode(derived)
         return key
     
     @staticmethod
@@ -56,13 +108,7 @@ class EncryptionManager:
         Returns:
             Encrypted data
         """
-        if key is None:
-            if ENCRYPTION_KEY is None:
-                raise ValueError("Encryption key not provided and not found in environment")
-            key = ENCRYPTION_KEY.encode()
-            
-        f = Fernet(key)
-        encrypted_data = f.encrypt(data.encode())
+        encrypted_data = _fernet_for(key).encrypt(data.encode())
         
         return encrypted_data
     
@@ -78,12 +124,6 @@ class EncryptionManager:
         Returns:
             Decrypted data as string
         """
-        if key is None:
-            if ENCRYPTION_KEY is None:
-                raise ValueError("Encryption key not provided and not found in environment")
-            key = ENCRYPTION_KEY.encode()
-            
-        f = Fernet(key)
-        decrypted_data = f.decrypt(encrypted_data).decode()
+        decrypted_data = _fernet_for(key).decrypt(encrypted_data).decode()
         
         return decrypted_data
\ No newline at end of file
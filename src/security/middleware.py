@@ -6,8 +6,10 @@ This module provides security middleware for protecting API endpoints and servic
 import os
 import time
 import hashlib
+import hmac
 import json
-from typing import Dict, List, Callable, Any, Optional
+import threading
+from typing import Dict, List, Callable, Any, Optional, Tuple
 from functools import wraps
 
 from .authentication import AuthenticationManager, AuthorizationManager
@@ -33,7 +35,9 @@ def authenticate_request(func: Callable) -> Callable:
         if not auth_header or not auth_header.startswith("Bearer "):
             return {"error": "Unauthorized - Missing or invalid token"}, 401
         
-        token = auth_header.split(" ")[1]
+        # verify_token serves repeated tokens from its own cache, so the
+        # decorator doesn't keep a second one
+        token = auth_header[len("Bearer "):]
         payload = AuthenticationManager.verify_token(token)
         
         if not payload:
@@ -57,6 +61,8 @@ def require_roles(required_roles: List[str]) -> Callable:
     Returns:
         Decorated function that checks user roles before processing
     """
+    allowed_roles = frozenset(required_roles)
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -68,7 +74,7 @@ def require_roles(required_roles: List[str]) -> Callable:
             
             user_roles = request.user.get("roles", [])
             
-            if not AuthorizationManager.has_permission(user_roles, required_roles):
+            if not AuthorizationManager.has_permission(user_roles, allowed_roles):
                 return {"error": "Forbidden - Insufficient permissions"}, 403
             
             return func(*args, **kwargs)
@@ -89,35 +95,45 @@ def rate_limit(max_requests: int, window_seconds: int) -> Callable:
     Returns:
         Decorated function that enforces rate limits
     """
-    # Store request counts by IP
-    request_records: Dict[str, List[float]] = {}
+    # Token bucket per IP: (tokens left, time of last refill). A bucket holds
+    # at most max_requests tokens and refills at max_requests per window.
+    request_records: Dict[str, Tuple[float, float]] = {}
+    refill_rate = max_requests / window_seconds
+    lock = threading.Lock()
+    next_sweep = time.time() + window_seconds
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
+            nonlocal next_sweep
+            
             # Extract client IP from the request
             request = args[0]
             client_ip = request.remote_addr
             
-            # Initialize request record for this IP if not exists
-            if client_ip not in request_records:
-                request_records[client_ip] = []
-            
             # Get current time
             current_time = time.time()
             
-            # Remove requests outside the window
-            request_records[client_ip] = [
-                timestamp for timestamp in request_records[client_ip]
-                if current_time - timestamp < window_seconds
-            ]
-            
-            # Check if rate limit exceeded
-            if len(request_records[client_ip]) >= max_requests:
-                return {"error": "Too many requests"}, 429
-            
-            # Add current request timestamp
-            request_records[client_ip].append(current_time)
+            with lock:
+                # Forget clients whose buckets have had a full window to refill
+                if current_time >= next_sweep:
+                    idle = [
+                        ip for ip, (_, last_refill) in request_records.items()
+                        if current_time - last_refill >= window_seconds
+                    ]
+                    for ip in idle:
+                        del request_records[ip]
+                    next_sweep = current_time + window_seconds
+                
+                tokens, last_refill = request_records.get(client_ip, (max_requests, current_time))
+                tokens = min(max_requests, tokens + (current_time - last_refill) * refill_rate)
+                
+                # Check if rate limit exceeded
+                if tokens < 1:
+                    request_records[client_ip] = (tokens, current_time)
+                    return {"error": "Too many requests"}, 429
+                
+                request_records[client_ip] = (tokens - 1, current_time)
             
             return func(*args, **kwargs)
         
@@ -148,7 +164,10 @@ def csrf_protection(func: Callable) -> Callable:
         csrf_token = request.headers.get("X-CSRF-Token")
         session_token = request.session.get("csrf_token")
         
-        if not csrf_token or not session_token or csrf_token != session_token:
+        # Constant-time comparison so the check doesn't leak how much of the token matched
+        if not csrf_token or not session_token or not hmac.compare_digest(
+            csrf_token.encode(), session_token.encode()
+        ):
             return {"error": "CSRF token validation failed"}, 403
         
         return func(*args, **kwargs)
@@ -156,6 +175,16 @@ def csrf_protection(func: Callable) -> Callable:
     return wrapper
 
 
+# Characters escaped by sanitize_input, applied in a single pass
+_HTML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
 def sanitize_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sanitize input data to prevent injection attacks
@@ -168,19 +197,27 @@ def sanitize_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     sanitized_data = {}
     
-    for key, value in input_data.items():
-        if isinstance(value, str):
-            # Basic sanitization - remove dangerous characters
-            sanitized_value = value.replace("<", "&lt;").replace(">", "&gt;")
-            sanitized_data[key] = sanitized_value
-        elif isinstance(value, dict):
-            sanitized_data[key] = sanitize_input(value)
-        elif isinstance(value, list):
-            sanitized_data[key] = [
-                sanitize_input(item) if isinstance(item, dict) else item
-                for item in value
-            ]
-        else:
-            sanitized_data[key] = value
+    # Walk nested dicts with an explicit stack of (source, destination) pairs
+    # so deeply nested payloads don't recurse
+    stack = [(input_data, sanitized_data)]
+    while stack:
+        source, destination = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, str):
+                destination[key] = value.translate(_HTML_ESCAPES)
+            elif isinstance(value, dict):
+                destination[key] = nested = {}
+                stack.append((value, nested))
+            elif isinstance(value, list):
+                items = []
+                for item in value:
+                    if isinstance(item, dict):
+                        nested = {}
+                        stack.append((item, nested))
+                        item = nested
+                    items.append(item)
+                destination[key] = items
+            else:
+                destination[key] = value
     
-    return sanitized_data
\ No newline at end of file
+    return sanitized_data
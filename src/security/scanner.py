@@ -6,22 +6,298 @@ This module provides security scanning capabilities to identify vulnerabilities.
 import os
 import re
 import json
+import logging
+import mmap
 import subprocess
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ahocorasick_rs import BytesAhoCorasick
+except ImportError:
+    BytesAhoCorasick = None
+
+logger = logging.getLogger(__name__)
+
+# A requirements-file comment: "#" at the start of a line or after whitespace
+_REQUIREMENT_COMMENT = re.compile(r'(^|\s)#.*$')
+
+_SECRET_RECOMMENDATION = "Remove hardcoded secrets and use environment variables instead"
+
+# (name, compiled pattern, severity, recommendation), compiled once at import.
+# Patterns are matched against the raw file bytes, so none of them may cross a
+# line break; backreferences use unique group names so they can be fused below.
+SECRET_PATTERNS = (
+    ("API Key", re.compile(rb'api[_-]?key[^a-zA-Z0-9\n]+(?P<api_quote>["\'`])[a-zA-Z0-9_\-]{20,}(?P=api_quote)'),
+     "HIGH", _SECRET_RECOMMENDATION),
+    ("AWS Key", re.compile(rb'(AKIA[0-9A-Z]{16})'),
+     "HIGH", _SECRET_RECOMMENDATION),
+    ("Generic Secret", re.compile(rb'(secret|password|token)[^a-zA-Z0-9\n]+(?P<secret_quote>["\'`])[a-zA-Z0-9]{10,}(?P=secret_quote)'),
+     "HIGH", _SECRET_RECOMMENDATION),
+    ("Private Key", re.compile(rb'-----BEGIN [A-Z ]+ PRIVATE KEY-----'),
+     "HIGH", _SECRET_RECOMMENDATION),
+    ("Connection String", re.compile(rb'(mongodb|postgresql|mysql|redis)://[a-zA-Z0-9]+:[a-zA-Z0-9]+@'),
+     "HIGH", _SECRET_RECOMMENDATION),
+)
+
+VULNERABILITY_PATTERNS = (
+    ("SQL Injection",
+     re.compile(rb'exec(?:ute)?(?:_sql|_query)?[^\S\n]*\([^\S\n]*["\']?[^\S\n]*(?:SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP)'),
+     "HIGH", "Use parameterized queries or an ORM instead of string concatenation"),
+    ("Command Injection",
+     re.compile(rb'(?:os\.system|subprocess\.(?:call|run|Popen)|popen|exec)[^\S\n]*\([^\S\n]*["\']?.*\$'),
+     "HIGH", "Use safe APIs and validate user input before passing to OS commands"),
+    ("XSS",
+     re.compile(rb'(?:innerHTML|outerHTML|document\.write|eval)[^\S\n]*\([^\S\n]*(?:[^)\n]*\$|.*\+[^\S\n]*.*)'),
+     "MEDIUM", "Use content security policy and sanitize user input"),
+    ("Path Traversal",
+     re.compile(rb'(?:open|read|write|file_get_contents)[^\S\n]*\([^\S\n]*["\']?.*\.\./'),
+     "MEDIUM", "Validate and sanitize file paths, use path normalization"),
+    ("Insecure Cookie",
+     re.compile(rb'(?:set_cookie|cookie)[^\S\n]*\([^\S\n]*[^)\n]*(?:secure[^\S\n]*=[^\S\n]*false|httponly[^\S\n]*=[^\S\n]*false)'),
+     "LOW", "Set secure and httpOnly flags on cookies"),
+)
+
+_NEWLINE = re.compile(rb"\n")
+
+
+def _combine(patterns) -> "re.Pattern":
+    """Fuse a pattern table into a single alternation"""
+    return re.compile(b"|".join(b"(?:" + pattern.pattern + b")" for _, pattern, _, _ in patterns))
+
+
+# A line is only checked against the individual patterns when the fused
+# alternation matches it, so clean lines cost one search instead of one per
+# pattern. Every pattern is still confirmed separately, since one line can
+# match several of them.
+_SECRETS_RE = _combine(SECRET_PATTERNS)
+_VULNERABILITIES_RE = _combine(VULNERABILITY_PATTERNS)
+_ALL_PATTERNS_RE = _combine(SECRET_PATTERNS + VULNERABILITY_PATTERNS)
+
+
+# Literal anchors: every match of every pattern above contains at least one
+# of these, so lines without any of them can be skipped outright. Keep this in
+# sync when adding patterns.
+ANCHOR_LITERALS = (
+    b"api", b"AKIA", b"secret", b"password", b"token", b"-----BEGIN ", b"://",
+    b"exec", b"os.system", b"subprocess.", b"open", b"read", b"write",
+    b"file_get_contents", b"innerHTML", b"outerHTML", b"eval", b"cookie",
+)
+
+# With ahocorasick_rs installed, one automaton pass over the file finds the
+# anchored lines and only those run the fused regex
+_ANCHORS = BytesAhoCorasick(list(ANCHOR_LITERALS)) if BytesAhoCorasick is not None else None
+
+
+def _regex_positions(content, combined: "re.Pattern"):
+    """Yield the first match offset on each line the fused pattern matches"""
+    match = combined.search(content)
+    while match:
+        yield match.start()
+        end = content.find(b"\n", match.start())
+        if end == -1:
+            return
+        match = combined.search(content, end + 1)
+
+
+def _matching_lines(content, combined: "re.Pattern"):
+    """
+    Yield (line number, line bytes) for every line the fused pattern matches
+    
+    Args:
+        content: File contents as bytes or a read-only mmap
+        combined: Fused pattern from _combine
+    """
+    if _ANCHORS is not None:
+        positions = (start for _, start, _ in _ANCHORS.find_matches_as_indexes(content))
+    else:
+        positions = _regex_positions(content, combined)
+    
+    line_number = 1
+    counted = 0
+    end = -1
+    for position in positions:
+        if position <= end:
+            continue
+        start = content.rfind(b"\n", 0, position) + 1
+        end = content.find(b"\n", position)
+        if end == -1:
+            end = len(content)
+        line = content[start:end]
+        if _ANCHORS is not None and not combined.search(line):
+            continue
+        line_number += len(_NEWLINE.findall(content, counted, start))
+        counted = start
+        yield line_number, line
+
+
+def _scan_file(path: str, file_path: str, tables, combined: "re.Pattern") -> Tuple[List[Dict[str, Any]], ...]:
+    """
+    Match one file against several pattern tables in a single pass
+    
+    Args:
+        path: Path of the file on disk
+        file_path: Path reported in the findings
+        tables: Pattern tables to check matching lines against
+        combined: Fused pattern covering every table
+        
+    Returns:
+        One list of findings per table, in the order given
+    """
+    findings = tuple([] for _ in tables)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return findings
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for line_number, line in _matching_lines(content, combined):
+                for patterns, table_findings in zip(tables, findings):
+                    for name, pattern, severity, recommendation in patterns:
+                        if pattern.search(line):
+                            table_findings.append({
+                                "file": file_path,
+                                "line": line_number,
+                                "type": name,
+                                "severity": severity,
+                                "recommendation": recommendation
+                            })
+    return findings
+
+
+# Mock vulnerability database, keyed by the affected requirement range
+# In a real implementation, you would query a vulnerability database
+MOCK_VULNERABILITY_DB = {
+    "django<3.2.14": {
+        "cve": "CVE-2022-36359",
+        "severity": "MEDIUM",
+        "description": "Potential reflected file download vulnerability",
+        "recommendation": "Upgrade to Django 3.2.14 or newer"
+    },
+    "flask<2.0.0": {
+        "cve": "CVE-2021-28091",
+        "severity": "MEDIUM",
+        "description": "Flask Cookie deserialization issue",
+        "recommendation": "Upgrade to Flask 2.0.0 or newer"
+    },
+    "requests<2.26.0": {
+        "cve": "CVE-2021-33503",
+        "severity": "LOW",
+        "description": "CRLF injection vulnerability",
+        "recommendation": "Upgrade to requests 2.26.0 or newer"
+    }
+}
+
+
+def _index_vulnerabilities(vulnerability_db: Dict[str, Dict[str, str]]) -> Dict[str, List[Tuple[SpecifierSet, Dict[str, str]]]]:
+    """Group advisories by normalized package name with parsed version ranges"""
+    index: Dict[str, List[Tuple[SpecifierSet, Dict[str, str]]]] = {}
+    for affected, vuln_info in vulnerability_db.items():
+        requirement = Requirement(affected)
+        index.setdefault(canonicalize_name(requirement.name), []).append(
+            (requirement.specifier, vuln_info)
+        )
+    return index
+
+
+def _lowest_allowed_version(specifier: SpecifierSet) -> Optional[Version]:
+    """
+    Return the lowest version a requirement pins or allows, if it has a lower bound
+    
+    Unbounded requirements return None, meaning any affected version may be installed.
+    """
+    lowest = None
+    for clause in specifier:
+        if clause.operator in ("==", "===", ">=", ">", "~=") and "*" not in clause.version:
+            try:
+                version = Version(clause.version)
+            except InvalidVersion:
+                continue
+            if lowest is None or version > lowest:
+                lowest = version
+    return lowest
+
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_SCAN_MIN_FILES = 64
+
+
+# Directories holding VCS data, environments, caches or build output
+SKIP_DIRS = frozenset({".git", ".venv", "venv", "node_modules", "__pycache__", ".tox", "build", "dist"})
+
+
+def _iter_python_files(repo_path: str):
+    """
+    Yield repository-relative paths of Python files, skipping SKIP_DIRS
+    
+    Uses os.scandir directly so file type checks come from the directory
+    entries instead of extra stat calls.
+    """
+    pending = [repo_path]
+    while pending:
+        directory = pending.pop()
+        subdirectories = []
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError as e:
+            # Skip unreadable directories, as os.walk does
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirectories.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file():
+                    yield os.path.relpath(entry.path, repo_path)
+            except OSError as e:
+                logger.warning(f"Skipping unreadable entry {entry.path}: {e}")
+        # Reverse so directories are visited in listing order, like os.walk
+        pending.extend(reversed(subdirectories))
+
+
+def _scan_one(repo_path: str, file_path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Scan one file for secrets and vulnerabilities (picklable pool worker)
+    
+    Uses the module-level pattern tables, which each worker process builds
+    once at import, rather than constructing a scanner per file.
+    """
+    try:
+        return _scan_file(os.path.join(repo_path, file_path), file_path,
+                          (SECRET_PATTERNS, VULNERABILITY_PATTERNS), _ALL_PATTERNS_RE)
+    except Exception as e:
+        print(f"Error scanning {file_path}: {e}")
+        return [], []
+
 
 class VulnerabilityScanner:
     """Scans code for security vulnerabilities"""
     
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, vulnerability_db: Optional[Dict[str, Dict[str, str]]] = None):
         """
         Initialize the vulnerability scanner
         
         Args:
             repo_path: Path to the code repository
+            vulnerability_db: Optional advisories keyed by requirement string
+                (e.g. "django<3.2.14"); defaults to MOCK_VULNERABILITY_DB
         """
         self.repo_path = repo_path
+        self.vulnerability_index = _index_vulnerabilities(
+            MOCK_VULNERABILITY_DB if vulnerability_db is None else vulnerability_db
+        )
         
     def scan_for_secrets(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -33,35 +309,12 @@ class VulnerabilityScanner:
         Returns:
             List of detected secrets with line numbers and patterns
         """
-        secrets = []
-        
-        # Patterns to detect secrets
-        secret_patterns = {
-            "API Key": r'api[_-]?key[^a-zA-Z0-9]+(["\'`])[a-zA-Z0-9]{20,}\\1',
-            "AWS Key": r'(AKIA[0-9A-Z]{16})',
-            "Generic Secret": r'(secret|password|token)[^a-zA-Z0-9]+(["\'`])[a-zA-Z0-9]{10,}\\2',
-            "Private Key": r'-----BEGIN [A-Z ]+ PRIVATE KEY-----',
-            "Connection String": r'(mongodb|postgresql|mysql|redis)://[a-zA-Z0-9]+:[a-zA-Z0-9]+@',
-        }
-        
         try:
-            with open(os.path.join(self.repo_path, file_path), 'r') as f:
-                content = f.readlines()
-                
-                for line_number, line in enumerate(content, 1):
-                    for pattern_name, pattern in secret_patterns.items():
-                        if re.search(pattern, line):
-                            secrets.append({
-                                "file": file_path,
-                                "line": line_number,
-                                "type": pattern_name,
-                                "severity": "HIGH",
-                                "recommendation": "Remove hardcoded secrets and use environment variables instead"
-                            })
+            return _scan_file(os.path.join(self.repo_path, file_path), file_path,
+                              (SECRET_PATTERNS,), _SECRETS_RE)[0]
         except Exception as e:
             print(f"Error scanning {file_path}: {e}")
-        
-        return secrets
+            return []
     
     def scan_for_vulnerabilities(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -73,55 +326,24 @@ class VulnerabilityScanner:
         Returns:
             List of detected vulnerabilities with line numbers and details
         """
-        vulnerabilities = []
-        
-        # Vulnerability patterns to check for
-        vulnerability_patterns = {
-            "SQL Injection": {
-                "pattern": r'exec(?:ute)?(?:_sql|_query)?\s*\(\s*["\']?\s*(?:SELECT|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP)',
-                "severity": "HIGH",
-                "recommendation": "Use parameterized queries or an ORM instead of string concatenation"
-            },
-            "Command Injection": {
-                "pattern": r'(?:os\.system|subprocess\.(?:call|run|Popen)|popen|exec)\s*\(\s*["\']?.*\$',
-                "severity": "HIGH",
-                "recommendation": "Use safe APIs and validate user input before passing to OS commands"
-            },
-            "XSS": {
-                "pattern": r'(?:innerHTML|outerHTML|document\.write|eval)\s*\(\s*(?:[^)]*\$|.*\+\s*.*)',
-                "severity": "MEDIUM",
-                "recommendation": "Use content security policy and sanitize user input"
-            },
-            "Path Traversal": {
-                "pattern": r'(?:open|read|write|file_get_contents)\s*\(\s*["\']?.*\.\./',
-                "severity": "MEDIUM",
-                "recommendation": "Validate and sanitize file paths, use path normalization"
-            },
-            "Insecure Cookie": {
-                "pattern": r'(?:set_cookie|cookie)\s*\(\s*[^)]*(?:secure\s*=\s*false|httponly\s*=\s*false)',
-                "severity": "LOW",
-                "recommendation": "Set secure and httpOnly flags on cookies"
-            }
-        }
-        
         try:
-            with open(os.path.join(self.repo_path, file_path), 'r') as f:
-                content = f.readlines()
-                
-                for line_number, line in enumerate(content, 1):
-                    for vuln_name, vuln_info in vulnerability_patterns.items():
-                        if re.search(vuln_info["pattern"], line):
-                            vulnerabilities.append({
-                                "file": file_path,
-                                "line": line_number,
-                                "type": vuln_name,
-                                "severity": vuln_info["severity"],
-                                "recommendation": vuln_info["recommendation"]
-                            })
+            return _scan_file(os.path.join(self.repo_path, file_path), file_path,
+                              (VULNERABILITY_PATTERNS,), _VULNERABILITIES_RE)[0]
         except Exception as e:
             print(f"Error scanning {file_path}: {e}")
+            return []
+    
+    def scan_file(self, file_path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Scan a file for secrets and vulnerabilities in a single read
         
-        return vulnerabilities
+        Args:
+            file_path: Path to the file to scan
+            
+        Returns:
+            Tuple of (secrets, vulnerabilities) as the individual scans report them
+        """
+        return _scan_one(self.repo_path, file_path)
     
     def scan_dependencies(self) -> List[Dict[str, Any]]:
         """
@@ -138,35 +360,25 @@ class VulnerabilityScanner:
             # This is a simplified mock implementation
             # In a real implementation, you would use a tool like safety or pip-audit
             with open(req_file, 'r') as f:
-                packages = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                
-                # Mock vulnerability database
-                # In a real implementation, you would query a vulnerability database
-                mock_vuln_db = {
-                    "django<3.2.14": {
-                        "cve": "CVE-2022-36359",
-                        "severity": "MEDIUM",
-                        "description": "Potential reflected file download vulnerability",
-                        "recommendation": "Upgrade to Django 3.2.14 or newer"
-                    },
-                    "flask<2.0.0": {
-                        "cve": "CVE-2021-28091",
-                        "severity": "MEDIUM",
-                        "description": "Flask Cookie deserialization issue",
-                        "recommendation": "Upgrade to Flask 2.0.0 or newer"
-                    },
-                    "requests<2.26.0": {
-                        "cve": "CVE-2021-33503",
-                        "severity": "LOW",
-                        "description": "CRLF injection vulnerability",
-                        "recommendation": "Upgrade to requests 2.26.0 or newer"
-                    }
-                }
+                packages = [_REQUIREMENT_COMMENT.sub('', line).strip() for line in f]
                 
                 for package in packages:
-                    for vuln_pattern, vuln_info in mock_vuln_db.items():
-                        package_name = package.split('==')[0] if '==' in package else package.split('>=')[0] if '>=' in package else package
-                        if package_name in vuln_pattern:
+                    if not package or package.startswith('-'):
+                        # Blank, comment-only, or pip options such as -r or -e
+                        continue
+                    try:
+                        requirement = Requirement(package)
+                    except InvalidRequirement as e:
+                        logger.warning(f"Skipping unparsable requirement {package!r} in {req_file}: {e}")
+                        continue
+                    
+                    known = self.vulnerability_index.get(canonicalize_name(requirement.name))
+                    if not known:
+                        continue
+                    
+                    lowest = _lowest_allowed_version(requirement.specifier)
+                    for affected, vuln_info in known:
+                        if lowest is None or affected.contains(lowest, prereleases=True):
                             vulnerabilities.append({
                                 "package": package,
                                 "cve": vuln_info["cve"],
@@ -188,21 +400,20 @@ class VulnerabilityScanner:
             Report data as a dictionary
         """
         # Get all Python files in the repo
-        python_files = []
-        for root, _, files in os.walk(self.repo_path):
-            for file in files:
-                if file.endswith('.py'):
-                    rel_path = os.path.relpath(os.path.join(root, file), self.repo_path)
-                    python_files.append(rel_path)
+        python_files = list(_iter_python_files(self.repo_path))
         
         # Scan each file
         all_secrets = []
         all_vulnerabilities = []
         
-        for file_path in python_files:
-            secrets = self.scan_for_secrets(file_path)
-            vulnerabilities = self.scan_for_vulnerabilities(file_path)
-            
+        scan = partial(_scan_one, self.repo_path)
+        if len(python_files) >= PARALLEL_SCAN_MIN_FILES:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(scan, python_files, chunksize=32))
+        else:
+            results = map(scan, python_files)
+        
+        for secrets, vulnerabilities in results:
             all_secrets.extend(secrets)
             all_vulnerabilities.extend(vulnerabilities)
         
@@ -225,7 +436,11 @@ class VulnerabilityScanner:
         }
         
         # Write report to file
-        with open(os.path.join(self.repo_path, output_file), 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(report, indent=2).encode()
+        with open(os.path.join(self.repo_path, output_file), 'wb') as f:
+            f.write(data)
         
         return report
\ No newline at end of file
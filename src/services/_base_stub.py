@@ -0,0 +1,87 @@
+"""
+Shared base for the generated stub services in AIDevOS.
+
+DeliveryService, NotificationService and TemplateService only differ in their
+name, so their request handling lives here.
+"""
+
+import logging
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+# Shared read-only default for requests without parameters
+_EMPTY = MappingProxyType({})
+
+
+class _BaseStubService:
+    """
+    Base implementation for stub services.
+    
+    Subclasses set SERVICE_NAME, which names their logger
+    ("aidevos.services.<SERVICE_NAME>").
+    """
+    
+    SERVICE_NAME = ""
+    
+    __slots__ = ("logger", "state")
+    
+    # Supported operations mapped to the method that handles them
+    _OPERATIONS = {
+        "get_data": "get_data",
+        "update_data": "update_data",
+    }
+    
+    def __init__(self):
+        """Initialize the service."""
+        self.logger = logging.getLogger(f"aidevos.services.{self.SERVICE_NAME}")
+        self.logger.info(f"Initializing {type(self).__name__}")
+        self.state = {}
+    
+    async def initialize(self) -> None:
+        """Initialize the service and load any necessary data."""
+        self.logger.info(f"{type(self).__name__} initialized")
+    
+    async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process a request to the service.
+        
+        Args:
+            request: Request data including operation and parameters
+            
+        Returns:
+            Response data from the service
+        """
+        operation = request.get("operation")
+        handler = self._OPERATIONS.get(operation)
+        
+        if handler is None:
+            return {"status": "error", "message": f"Unsupported operation: {operation}"}
+        return await getattr(self, handler)(request.get("parameters") or _EMPTY)
+    
+    async def get_data(self, parameters: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Get data from the service.
+        
+        Args:
+            parameters: Parameters for the data retrieval
+            
+        Returns:
+            Retrieved data or error message
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Getting data with parameters: {dict(parameters)}")
+        return {"status": "success", "data": {}}
+    
+    async def update_data(self, parameters: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Update data in the service.
+        
+        Args:
+            parameters: Parameters for the data update
+            
+        Returns:
+            Update status and result
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Updating data with parameters: {dict(parameters)}")
+        return {"status": "success", "updated": True}
@@ -7,17 +7,82 @@ This module provides data storage and retrieval functionality.
 import json
 import logging
 import os
-import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
+from .fastuuid import new_uuid
+
+# Logging is configured by the application; the library only adds a NullHandler
 logger = logging.getLogger("aidevos.services.data_service")
+logger.addHandler(logging.NullHandler())
+
+# Error messages returned to callers
+ERROR_INVALID_SESSION = "Invalid session"
+ERROR_NOT_FOUND = "Data item not found"
+ERROR_ACCESS_DENIED = "Access denied"
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_second_prefix = (None, "")
+
+
+def _now_iso() -> str:
+    """
+    Return the current UTC time in ISO 8601 format with microseconds.
+    
+    The date and time part is only formatted once per second; calls within the
+    same second reuse it and only append the microseconds.
+    """
+    global _second_prefix
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _second_prefix
+    if cached_second != seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _second_prefix = (seconds, prefix)
+    return f"{prefix}.{micros:06d}"
+
+
+class DataItem:
+    """
+    A stored data item.
+    
+    Uses __slots__ so each item carries no per-instance __dict__.
+    """
+    
+    __slots__ = ("id", "type", "content", "owner_id", "created_at", "updated_at")
+    
+    def __init__(self, data_id: str, data_type: str, content: Dict[str, Any], owner_id: str, timestamp: str):
+        """
+        Initialize a data item.
+        
+        Args:
+            data_id: ID of the data item
+            data_type: Type of the data
+            content: Data content
+            owner_id: ID of the owning user
+            timestamp: Creation time, also used as the initial update time
+        """
+        self.id = data_id
+        self.type = data_type
+        self.content = content
+        self.owner_id = owner_id
+        self.created_at = timestamp
+        self.updated_at = timestamp
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the data item as a dictionary.
+        
+        Returns:
+            Dictionary with all data item fields
+        """
+        return {
+            "id": self.id,
+            "type": self.type,
+            "content": self.content,
+            "owner_id": self.owner_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
 
 
 class DataService:
@@ -25,6 +90,8 @@ class DataService:
     Data Service Durable Object for data storage and retrieval.
     """
     
+    __slots__ = ("service_id", "config", "data_store", "by_owner", "by_owner_type", "user_service")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Data Service.
@@ -32,13 +99,19 @@ class DataService:
         Args:
             config: Configuration parameters for the service
         """
-        self.service_id = str(uuid.uuid4())
+        self.service_id = new_uuid()
         self.config = config
-        self.data_store = {}
+        self.data_store: Dict[str, DataItem] = {}
+        # Secondary indexes: owner -> data IDs and (owner, type) -> data IDs.
+        # The ID collections are dicts used as ordered sets, so listings keep
+        # creation order.
+        self.by_owner: Dict[str, Dict[str, None]] = {}
+        self.by_owner_type: Dict[Tuple[str, str], Dict[str, None]] = {}
         self.user_service = None  # This would be injected by the DO framework
         
         logger.info(f"Initializing Data Service {self.service_id}")
-        logger.info(f"Configuration: {json.dumps(config, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Configuration: %s", json.dumps(config, indent=2))
     
     def set_user_service(self, user_service: Any) -> None:
         """
@@ -50,6 +123,29 @@ class DataService:
         self.user_service = user_service
         logger.info("User service dependency injected")
     
+    def _resolve_user(self, session_id: str, operation: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Resolve the user behind a session.
+        
+        Args:
+            session_id: Session ID for authentication
+            operation: Operation name used in the failure log message
+            
+        Returns:
+            Tuple of (user ID, None) if the session is valid, or (None, error response)
+        """
+        if not self.user_service:
+            # For testing without user service
+            return "test_user", None
+        
+        session_result = self.user_service.validate_session(session_id)
+        if not session_result.get("valid", False):
+            error = session_result.get("error", ERROR_INVALID_SESSION)
+            logger.warning(f"Data {operation} failed: {error}")
+            return None, {"error": error}
+        
+        return session_result["user_id"], None
+    
     def create_data_item(self, session_id: str, data_type: str, content: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new data item.
@@ -62,33 +158,20 @@ class DataService:
         Returns:
             Dictionary containing the created data item information
         """
-        # Validate session
-        if self.user_service:
-            session_result = self.user_service.validate_session(session_id)
-            if not session_result.get("valid", False):
-                logger.warning(f"Data creation failed: {session_result.get('error', 'Invalid session')}")
-                return {"error": session_result.get("error", "Invalid session")}
-            
-            user_id = session_result["user_id"]
-        else:
-            # For testing without user service
-            user_id = "test_user"
+        user_id, error = self._resolve_user(session_id, "creation")
+        if error:
+            return error
         
         # Create data item
-        data_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat()
+        data_id = new_uuid()
+        timestamp = _now_iso()
         
-        data_item = {
-            "id": data_id,
-            "type": data_type,
-            "content": content,
-            "owner_id": user_id,
-            "created_at": timestamp,
-            "updated_at": timestamp
-        }
+        data_item = DataItem(data_id, data_type, content, user_id, timestamp)
         
         # Store data item
         self.data_store[data_id] = data_item
+        self.by_owner.setdefault(user_id, {})[data_id] = None
+        self.by_owner_type.setdefault((user_id, data_type), {})[data_id] = None
         
         logger.info(f"Created data item {data_id} of type {data_type}")
         return {
@@ -109,32 +192,25 @@ class DataService:
         Returns:
             Dictionary containing the data item
         """
-        # Validate session
-        if self.user_service:
-            session_result = self.user_service.validate_session(session_id)
-            if not session_result.get("valid", False):
-                logger.warning(f"Data retrieval failed: {session_result.get('error', 'Invalid session')}")
-                return {"error": session_result.get("error", "Invalid session")}
-            
-            user_id = session_result["user_id"]
-        else:
-            # For testing without user service
-            user_id = "test_user"
+        user_id, error = self._resolve_user(session_id, "retrieval")
+        if error:
+            return error
         
         # Retrieve data item
         if data_id not in self.data_store:
             logger.warning(f"Data item {data_id} not found")
-            return {"error": "Data item not found"}
+            return {"error": ERROR_NOT_FOUND}
         
         data_item = self.data_store[data_id]
         
         # Check ownership
-        if data_item["owner_id"] != user_id:
+        if data_item.owner_id != user_id:
             logger.warning(f"Access denied: User {user_id} does not own data item {data_id}")
-            return {"error": "Access denied"}
+            return {"error": ERROR_ACCESS_DENIED}
         
-        logger.info(f"Retrieved data item {data_id}")
-        return data_item
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Retrieved data item {data_id}")
+        return data_item.to_dict()
     
     def update_data_item(self, session_id: str, data_id: str, content: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -148,39 +224,31 @@ class DataService:
         Returns:
             Dictionary containing the updated data item information
         """
-        # Validate session
-        if self.user_service:
-            session_result = self.user_service.validate_session(session_id)
-            if not session_result.get("valid", False):
-                logger.warning(f"Data update failed: {session_result.get('error', 'Invalid session')}")
-                return {"error": session_result.get("error", "Invalid session")}
-            
-            user_id = session_result["user_id"]
-        else:
-            # For testing without user service
-            user_id = "test_user"
+        user_id, error = self._resolve_user(session_id, "update")
+        if error:
+            return error
         
         # Check if data item exists
         if data_id not in self.data_store:
             logger.warning(f"Data item {data_id} not found")
-            return {"error": "Data item not found"}
+            return {"error": ERROR_NOT_FOUND}
         
         data_item = self.data_store[data_id]
         
         # Check ownership
-        if data_item["owner_id"] != user_id:
+        if data_item.owner_id != user_id:
             logger.warning(f"Access denied: User {user_id} does not own data item {data_id}")
-            return {"error": "Access denied"}
+            return {"error": ERROR_ACCESS_DENIED}
         
         # Update data item
-        data_item["content"] = content
-        data_item["updated_at"] = datetime.utcnow().isoformat()
+        data_item.content = content
+        data_item.updated_at = _now_iso()
         
         logger.info(f"Updated data item {data_id}")
         return {
             "id": data_id,
-            "type": data_item["type"],
-            "updated_at": data_item["updated_at"]
+            "type": data_item.type,
+            "updated_at": data_item.updated_at
         }
     
     def delete_data_item(self, session_id: str, data_id: str) -> Dict[str, Any]:
@@ -194,36 +262,121 @@ class DataService:
         Returns:
             Dictionary containing the deletion result
         """
-        # Validate session
-        if self.user_service:
-            session_result = self.user_service.validate_session(session_id)
-            if not session_result.get("valid", False):
-                logger.warning(f"Data deletion failed: {session_result.get('error', 'Invalid session')}")
-                return {"error": session_result.get("error", "Invalid session")}
-            
-            user_id = session_result["user_id"]
-        else:
-            # For testing without user service
-            user_id = "test_user"
+        user_id, error = self._resolve_user(session_id, "deletion")
+        if error:
+            return error
         
         # Check if data item exists
         if data_id not in self.data_store:
             logger.warning(f"Data item {data_id} not found")
-            return {"error": "Data item not found"}
+            return {"error": ERROR_NOT_FOUND}
         
         data_item = self.data_store[data_id]
         
         # Check ownership
-        if data_item["owner_id"] != user_id:
+        if data_item.owner_id != user_id:
             logger.warning(f"Access denied: User {user_id} does not own data item {data_id}")
-            return {"error": "Access denied"}
+            return {"error": ERROR_ACCESS_DENIED}
         
         # Delete data item
         del self.data_store[data_id]
+        self._unindex(data_id, user_id, data_item.type)
         
         logger.info(f"Deleted data item {data_id}")
         return {"success": True}
     
+    def create_data_items(self, session_id: str, items: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Create several data items with a single session validation.
+        
+        Args:
+            session_id: Session ID for authentication
+            items: (data type, content) pairs to store
+            
+        Returns:
+            Dictionary containing the created data items' information, in input order
+        """
+        user_id, error = self._resolve_user(session_id, "creation")
+        if error:
+            return error
+        
+        if not items:
+            return {"items": []}
+        
+        timestamp = _now_iso()
+        data_store = self.data_store
+        owner_ids = self.by_owner.setdefault(user_id, {})
+        by_owner_type = self.by_owner_type
+        created = []
+        
+        for data_type, content in items:
+            data_id = new_uuid()
+            data_store[data_id] = DataItem(data_id, data_type, content, user_id, timestamp)
+            owner_ids[data_id] = None
+            by_owner_type.setdefault((user_id, data_type), {})[data_id] = None
+            created.append({
+                "id": data_id,
+                "type": data_type,
+                "created_at": timestamp,
+                "updated_at": timestamp
+            })
+        
+        logger.info(f"Created {len(created)} data items for user {user_id}")
+        return {"items": created}
+    
+    def delete_data_items(self, session_id: str, data_ids: List[str]) -> Dict[str, Any]:
+        """
+        Delete several data items with a single session validation.
+        
+        Items that don't exist or aren't owned by the user are reported
+        individually and don't stop the rest of the batch.
+        
+        Args:
+            session_id: Session ID for authentication
+            data_ids: IDs of the data items to delete
+            
+        Returns:
+            Dictionary with the deleted IDs and the per-item failures
+        """
+        user_id, error = self._resolve_user(session_id, "deletion")
+        if error:
+            return error
+        
+        deleted = []
+        failed = []
+        
+        for data_id in data_ids:
+            data_item = self.data_store.get(data_id)
+            if data_item is None:
+                failed.append({"id": data_id, "error": ERROR_NOT_FOUND})
+            elif data_item.owner_id != user_id:
+                failed.append({"id": data_id, "error": ERROR_ACCESS_DENIED})
+            else:
+                del self.data_store[data_id]
+                self._unindex(data_id, user_id, data_item.type)
+                deleted.append(data_id)
+        
+        if failed:
+            logger.warning(f"Failed to delete {len(failed)} of {len(data_ids)} data items for user {user_id}")
+        logger.info(f"Deleted {len(deleted)} data items for user {user_id}")
+        return {"deleted": deleted, "failed": failed}
+    
+    def _unindex(self, data_id: str, owner_id: str, data_type: str) -> None:
+        """
+        Remove a data item from the secondary indexes.
+        
+        Args:
+            data_id: ID of the removed data item
+            owner_id: ID of the item's owner
+            data_type: Type of the item
+        """
+        for index, key in ((self.by_owner, owner_id), (self.by_owner_type, (owner_id, data_type))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(data_id, None)
+                if not ids:
+                    del index[key]
+    
     def list_data_items(self, session_id: str, data_type: Optional[str] = None) -> Dict[str, Any]:
         """
         List data items owned by the user.
@@ -235,30 +388,27 @@ class DataService:
         Returns:
             Dictionary containing the list of data items
         """
-        # Validate session
-        if self.user_service:
-            session_result = self.user_service.validate_session(session_id)
-            if not session_result.get("valid", False):
-                logger.warning(f"Data listing failed: {session_result.get('error', 'Invalid session')}")
-                return {"error": session_result.get("error", "Invalid session")}
-            
-            user_id = session_result["user_id"]
+        user_id, error = self._resolve_user(session_id, "listing")
+        if error:
+            return error
+        
+        # Look up the user's items (optionally of one type) in the indexes
+        if data_type is None:
+            item_ids = self.by_owner.get(user_id, ())
         else:
-            # For testing without user service
-            user_id = "test_user"
-        
-        # Filter data items by owner and type
-        items = []
-        for item_id, item in self.data_store.items():
-            if item["owner_id"] == user_id:
-                if data_type is None or item["type"] == data_type:
-                    # Return item without content for listing
-                    items.append({
-                        "id": item["id"],
-                        "type": item["type"],
-                        "created_at": item["created_at"],
-                        "updated_at": item["updated_at"]
-                    })
+            item_ids = self.by_owner_type.get((user_id, data_type), ())
+        
+        # Return items without content for listing
+        data_store = self.data_store
+        items = [
+            {
+                "id": item.id,
+                "type": item.type,
+                "created_at": item.created_at,
+                "updated_at": item.updated_at
+            }
+            for item in map(data_store.__getitem__, item_ids)
+        ]
         
         logger.info(f"Listed {len(items)} data items for user {user_id}")
         return {"items": items}
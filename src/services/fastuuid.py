@@ -0,0 +1,38 @@
+"""
+Fast UUID generation for AIDevOS services.
+
+This module generates random (version 4) UUIDs from a per-thread PRNG seeded
+once from os.urandom, avoiding a urandom syscall per identifier. The IDs are
+unique but predictable, so they must not be used as secrets such as session
+tokens.
+"""
+
+import os
+import random
+import threading
+import uuid
+
+_local = threading.local()
+
+
+def _reset() -> None:
+    """Drop per-thread generators so a forked child reseeds its own."""
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset)
+
+
+def new_uuid() -> str:
+    """
+    Generate a random UUID string.
+    
+    Returns:
+        A version 4 UUID in the same format as str(uuid.uuid4())
+    """
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = random.Random(os.urandom(32))
+    return str(uuid.UUID(bytes=rng.randbytes(16), version=4))
@@ -5,70 +5,19 @@ NotificationService implementation for AIDevOS.
 This service provides functionality for Core service for managing notifications.
 """
 
-import json
 import logging
-from typing import Dict, List, Any, Optional
+
+from ._base_stub import _BaseStubService
 
 logger = logging.getLogger("aidevos.services.notificationservice")
 
-class NotificationService:
+class NotificationService(_BaseStubService):
     """
     NotificationService implementation.
     
     This class provides functionality for Core service for managing notifications.
     """
     
-    def __init__(self):
-        """Initialize the NotificationService."""
-        self.logger = logging.getLogger(f"aidevos.services.notificationservice")
-        self.logger.info(f"Initializing NotificationService")
-        self.state = {}
-    
-    async def initialize(self) -> None:
-        """Initialize the service and load any necessary data."""
-        self.logger.info(f"NotificationService initialized")
-    
-    async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Process a request to the service.
-        
-        Args:
-            request: Request data including operation and parameters
-            
-        Returns:
-            Response data from the service
-        """
-        operation = request.get("operation")
-        
-        if operation == "get_data":
-            return await self.get_data(request.get("parameters", {}))
-        elif operation == "update_data":
-            return await self.update_data(request.get("parameters", {}))
-        else:
-            return {"status": "error", "message": f"Unsupported operation: {operation}"}
-    
-    async def get_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Get data from the service.
-        
-        Args:
-            parameters: Parameters for the data retrieval
-            
-        Returns:
-            Retrieved data or error message
-        """
-        self.logger.info(f"Getting data with parameters: {parameters}")
-        return {"status": "success", "data": {}}
+    SERVICE_NAME = "notificationservice"
     
-    async def update_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Update data in the service.
-        
-        Args:
-            parameters: Parameters for the data update
-            
-        Returns:
-            Update status and result
-        """
-        self.logger.info(f"Updating data with parameters: {parameters}")
-        return {"status": "success", "updated": True}
+    __slots__ = ()
@@ -4,20 +4,20 @@ User Service Durable Object for AIDevOS.
 This module provides user authentication and management functionality.
 """
 
+import heapq
 import json
 import logging
 import os
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler()],
-)
+from .fastuuid import new_uuid
+
+# Logging is configured by the application; the library only adds a NullHandler
 logger = logging.getLogger("aidevos.services.user_service")
+logger.addHandler(logging.NullHandler())
 
 
 class UserService:
@@ -25,6 +25,8 @@ class UserService:
     User Service Durable Object for user authentication and management.
     """
     
+    __slots__ = ("service_id", "config", "users", "users_by_id", "sessions", "_expiry_heap")
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the User Service.
@@ -32,13 +34,19 @@ class UserService:
         Args:
             config: Configuration parameters for the service
         """
-        self.service_id = str(uuid.uuid4())
+        self.service_id = new_uuid()
         self.config = config
         self.users = {}
+        # Secondary index: user ID -> username
+        self.users_by_id: Dict[str, str] = {}
         self.sessions = {}
+        # (expires_ts, session_id) min-heap so expired sessions can be
+        # removed without scanning every session
+        self._expiry_heap: List[Tuple[float, str]] = []
         
         logger.info(f"Initializing User Service {self.service_id}")
-        logger.info(f"Configuration: {json.dumps(config, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Configuration: %s", json.dumps(config, indent=2))
     
     def create_user(self, username: str, password: str, email: str) -> Dict[str, Any]:
         """
@@ -57,7 +65,7 @@ class UserService:
             return {"error": "User already exists"}
         
         # In a real implementation, we would hash the password
-        user_id = str(uuid.uuid4())
+        user_id = new_uuid()
         self.users[username] = {
             "id": user_id,
             "username": username,
@@ -66,6 +74,7 @@ class UserService:
             "created_at": datetime.utcnow().isoformat(),
             "last_login": None
         }
+        self.users_by_id[user_id] = username
         
         logger.info(f"Created user {username} with ID {user_id}")
         return {
@@ -96,15 +105,20 @@ class UserService:
             return {"error": "Invalid username or password"}
         
         # Create a session
+        # Session IDs act as bearer secrets, so they stay on os.urandom
         session_id = str(uuid.uuid4())
         expiration = datetime.utcnow() + timedelta(hours=24)
+        expires_ts = time.time() + timedelta(hours=24).total_seconds()
         
         self.sessions[session_id] = {
             "user_id": user["id"],
             "username": username,
             "created_at": datetime.utcnow().isoformat(),
-            "expires_at": expiration.isoformat()
+            "expires_at": expiration.isoformat(),
+            # Epoch seconds, so validation is a float compare instead of a parse
+            "expires_ts": expires_ts
         }
+        heapq.heappush(self._expiry_heap, (expires_ts, session_id))
         
         # Update last login time
         self.users[username]["last_login"] = datetime.utcnow().isoformat()
@@ -128,19 +142,20 @@ class UserService:
         Returns:
             Dictionary containing user information
         """
-        for username, user in self.users.items():
-            if user["id"] == user_id:
-                # Return user info without password
-                return {
-                    "id": user["id"],
-                    "username": user["username"],
-                    "email": user["email"],
-                    "created_at": user["created_at"],
-                    "last_login": user["last_login"]
-                }
-        
-        logger.warning(f"User with ID {user_id} not found")
-        return {"error": "User not found"}
+        username = self.users_by_id.get(user_id)
+        if username is None:
+            logger.warning(f"User with ID {user_id} not found")
+            return {"error": "User not found"}
+        
+        user = self.users[username]
+        # Return user info without password
+        return {
+            "id": user["id"],
+            "username": user["username"],
+            "email": user["email"],
+            "created_at": user["created_at"],
+            "last_login": user["last_login"]
+        }
     
     def validate_session(self, session_id: str) -> Dict[str, Any]:
         """
@@ -157,21 +172,56 @@ class UserService:
             return {"valid": False, "error": "Invalid session"}
         
         session = self.sessions[session_id]
-        expires_at = datetime.fromisoformat(session["expires_at"])
+        now = time.time()
         
-        if datetime.utcnow() > expires_at:
+        if now > session["expires_ts"]:
             logger.warning(f"Session {session_id} has expired")
             # Clean up expired session
             del self.sessions[session_id]
             return {"valid": False, "error": "Session expired"}
         
-        logger.info(f"Session {session_id} is valid")
+        # Drop other sessions that expired without being used again; the
+        # heap top is checked here so the common case costs one comparison
+        heap = self._expiry_heap
+        if heap and heap[0][0] < now:
+            self.sweep_expired()
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Session {session_id} is valid")
         return {
             "valid": True,
             "user_id": session["user_id"],
             "username": session["username"]
         }
     
+    def sweep_expired(self) -> int:
+        """
+        Remove all expired sessions.
+        
+        Sessions are popped from an expiry-ordered heap, so the cost is
+        proportional to the number of expired sessions, not to all sessions.
+        validate_session calls this once the earliest expiry has passed, which
+        also clears abandoned sessions.
+        
+        Returns:
+            Number of sessions removed
+        """
+        now = time.time()
+        heap = self._expiry_heap
+        expired = 0
+        while heap and heap[0][0] < now:
+            _, session_id = heapq.heappop(heap)
+            # The session may already be gone through logout or validation,
+            # leaving this heap entry stale
+            session = self.sessions.get(session_id)
+            if session is not None and session["expires_ts"] < now:
+                del self.sessions[session_id]
+                expired += 1
+        
+        if expired:
+            logger.info(f"Removed {expired} expired sessions")
+        return expired
+    
     def logout(self, session_id: str) -> Dict[str, Any]:
         """
         Log out a user by invalidating their session.
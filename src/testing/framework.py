@@ -270,7 +270,7 @@ class BaseTest:
         """
         self.level = level
         self.environment = environment
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         
         logger.info(f"Initializing {level.value} test in {environment.value} environment")
     
@@ -281,7 +281,7 @@ class BaseTest:
     def teardown(self) -> None:
         """Tear down the test environment."""
         logger.info("Tearing down test environment")
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         logger.info(f"Test completed in {duration:.2f} seconds")
     
     def assert_success(self, result: Any, message: str = "Expected success") -> None:
@@ -134,14 +134,48 @@ def build_test_command(args: argparse.Namespace) -> List[str]:
     return command
 
 
-def main() -> int:
+def run_test_suite(
+    test_path: str = "tests",
+    level: Optional[str] = None,
+    environment: Optional[str] = None,
+    pattern: Optional[str] = "test_*.py",
+    component: Optional[str] = None,
+    xml_report: bool = False,
+    coverage: bool = False,
+    verbose: bool = False,
+    quiet: bool = False,
+) -> int:
     """
-    Main entry point for the test runner script.
+    Run the test suite with the given options.
     
+    Takes the same options as the command line, so callers can run tests
+    without building and re-parsing an argument list.
+    
+    Args:
+        test_path: Path to the tests to run
+        level: Test level to run
+        environment: Test environment to use
+        pattern: Pattern for test files
+        component: Component to test
+        xml_report: Generate XML report
+        coverage: Generate coverage report
+        verbose: Enable verbose output
+        quiet: Suppress output
+        
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
-    args = parse_args()
+    args = argparse.Namespace(
+        test_path=test_path,
+        level=level,
+        environment=environment,
+        pattern=pattern,
+        component=component,
+        xml_report=xml_report,
+        coverage=coverage,
+        verbose=verbose,
+        quiet=quiet,
+    )
     
     # Set environment variable for test environment
     if args.environment:
@@ -154,7 +188,7 @@ def main() -> int:
         logging.getLogger().setLevel(logging.DEBUG)
     
     logger.info("Starting AIDevOS test run")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Build pytest command
     command = build_test_command(args)
@@ -165,12 +199,22 @@ def main() -> int:
     result = pytest.main(command)
     
     # Log summary
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
     logger.info(f"Test run completed in {duration:.2f} seconds")
     
     # Return appropriate exit code
     return result
 
 
+def main() -> int:
+    """
+    Main entry point for the test runner script.
+    
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    return run_test_suite(**vars(parse_args()))
+
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -5,11 +5,17 @@ This module contains tests for the orchestration layer components,
 including the service registry, request router, and lifecycle manager.
 """
 
+import asyncio
+import gzip
 import pytest
 import json
+import unittest
 from typing import Any, Dict
 
 from src.testing.framework import TestFixtures, UnitTest, IntegrationTest, TestEnvironment
+from src.orchestration import durable_objects, openapi_spec
+from src.orchestration.database import DurableObject, InMemoryDataStore, durable_object_store
+from src.orchestration.durable_objects import registry
 
 
 class TestServiceRegistry(UnitTest):
@@ -198,4 +204,497 @@ class TestOrchestrationIntegration(IntegrationTest):
         
         # Verify events were published for each lifecycle stage
         # In a real implementation, this would check for specific events
-        assert len(mock_event_bus.published_events) == 0  # Would be > 0 in a real implementation
\ No newline at end of file
+        assert len(mock_event_bus.published_events) == 0  # Would be > 0 in a real implementation
+
+
+class TestDurableObjectPersistence(unittest.TestCase):
+    """Tests for Durable Object state persistence."""
+    
+    def setUp(self):
+        """Count writes made to the durable object store."""
+        self.loop = asyncio.new_event_loop()
+        self.writes = []
+        self._original_patch = durable_object_store.patch
+        self._original_create = durable_object_store.create
+        
+        async def counting_patch(object_id, changes):
+            result = await self._original_patch(object_id, changes)
+            if result is not None:
+                self.writes.append(object_id)
+            return result
+        
+        async def counting_create(item):
+            self.writes.append(item.id)
+            return await self._original_create(item)
+        
+        durable_object_store.patch = counting_patch
+        durable_object_store.create = counting_create
+    
+    def tearDown(self):
+        """Restore the durable object store."""
+        durable_object_store.patch = self._original_patch
+        durable_object_store.create = self._original_create
+        self.loop.close()
+    
+    def test_writes_are_coalesced(self):
+        """Test that a burst of requests results in a single store write."""
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "test-project", "Test Storage")
+            durable_object = await registry.get_object(object_id)
+            del self.writes[:]
+            for i in range(5):
+                await durable_object.process_request(
+                    "store_data", {"collection": "items", "id": str(i), "data": {"value": i}}
+                )
+            writes_before_flush = len(self.writes)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            writes_after_flush = len(self.writes)
+            await registry.delete_object(object_id)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return writes_before_flush, writes_after_flush
+        
+        before, after = self.loop.run_until_complete(scenario())
+        self.assertEqual(before, 0)
+        self.assertEqual(after, 1)
+    
+    def test_terminate_flushes_immediately(self):
+        """Test that terminating an object writes its state without waiting."""
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "test-project", "Test Storage")
+            del self.writes[:]
+            await registry.delete_object(object_id)
+            writes_after_delete = len(self.writes)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return writes_after_delete, len(self.writes)
+        
+        after_delete, after_flush = self.loop.run_until_complete(scenario())
+        self.assertEqual(after_delete, 1)
+        self.assertEqual(after_flush, 1)
+    
+    def test_failed_flush_is_retried(self):
+        """Test that state from a failed deferred write is persisted by a later flush."""
+        counting_patch = durable_object_store.patch
+        failures = []
+        
+        async def failing_once_patch(object_id, changes):
+            if not failures:
+                failures.append(object_id)
+                raise RuntimeError("store unavailable")
+            return await counting_patch(object_id, changes)
+        
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "test-project", "Retried Storage")
+            durable_object = await registry.get_object(object_id)
+            del self.writes[:]
+            durable_object_store.patch = failing_once_patch
+            durable_object.state["k"] = 1
+            await durable_object._save_state()
+            await asyncio.sleep(4 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            writes, dirty = list(self.writes), durable_object._dirty
+            await registry.delete_object(object_id)
+            return object_id, writes, dirty
+        
+        with self.assertLogs(durable_objects.logger, level="ERROR"):
+            object_id, writes, dirty = self.loop.run_until_complete(scenario())
+        self.assertEqual(failures, [object_id])
+        self.assertEqual(writes, [object_id])
+        self.assertFalse(dirty)
+    
+    def test_save_after_delete_does_not_recreate_object(self):
+        """Test that a held reference saving after deletion does not bring the record back."""
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "test-project", "Deleted Storage")
+            durable_object = await registry.get_object(object_id)
+            await registry.delete_object(object_id)
+            durable_object.state["k"] = 1
+            await durable_object._save_state()
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return object_id, await durable_object_store.read(object_id)
+        
+        with self.assertLogs(durable_objects.logger, level="WARNING") as logs:
+            object_id, record = self.loop.run_until_complete(scenario())
+        self.assertIsNone(record)
+        self.assertIn(object_id, logs.output[-1])
+    
+    def test_created_object_is_listed_immediately(self):
+        """Test that a new object is written before create_object returns."""
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "listed-project", "Listed Storage")
+            writes_after_create = len(self.writes)
+            listed = await registry.list_objects(project_id="listed-project")
+            await registry.delete_object(object_id)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return object_id, writes_after_create, listed
+        
+        object_id, writes_after_create, listed = self.loop.run_until_complete(scenario())
+        self.assertEqual(writes_after_create, 1)
+        self.assertEqual([item["id"] for item in listed], [object_id])
+
+
+class TestDurableObjectRegistryCache(unittest.TestCase):
+    """Tests for the Durable Object registry's active object cache."""
+    
+    def setUp(self):
+        """Shrink the active object cache."""
+        self.loop = asyncio.new_event_loop()
+        self._original_max_active = registry._MAX_ACTIVE
+        registry._MAX_ACTIVE = 2
+    
+    def tearDown(self):
+        """Restore the active object cache size."""
+        registry._MAX_ACTIVE = self._original_max_active
+        self.loop.close()
+    
+    def test_least_recently_used_object_is_evicted(self):
+        """Test that the oldest object is hibernated and reloaded on demand."""
+        async def scenario():
+            object_ids = [
+                await registry.create_object("DataStorageDO", "test-project", f"Storage {i}")
+                for i in range(3)
+            ]
+            evicted = object_ids[0] not in registry._active_objects
+            reloaded = await registry.get_object(object_ids[0])
+            reloaded_status = reloaded.status
+            for object_id in object_ids:
+                await registry.delete_object(object_id)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return evicted, reloaded, reloaded_status
+        
+        evicted, reloaded, reloaded_status = self.loop.run_until_complete(scenario())
+        self.assertTrue(evicted)
+        self.assertIsNotNone(reloaded)
+        self.assertEqual(reloaded.name, "Storage 0")
+        self.assertEqual(reloaded_status, "active")
+    
+    def test_idle_objects_are_hibernated(self):
+        """Test that the idle sweep hibernates and deactivates idle objects."""
+        registry._IDLE_TTL = 0
+        
+        async def scenario():
+            object_id = await registry.create_object("DataStorageDO", "test-project", "Idle Storage")
+            durable_object = registry._active_objects[object_id]
+            await registry.hibernate_idle_objects()
+            deactivated = object_id not in registry._active_objects
+            status = durable_object.status
+            await registry.delete_object(object_id)
+            await asyncio.sleep(2 * durable_objects.FLUSH_INTERVAL_MS / 1000)
+            return deactivated, status
+        
+        try:
+            deactivated, status = self.loop.run_until_complete(scenario())
+        finally:
+            del registry._IDLE_TTL
+        self.assertTrue(deactivated)
+        self.assertEqual(status, "hibernating")
+    
+    def test_failed_sweep_is_logged(self):
+        """Test that an exception in the background idle sweep is logged."""
+        async def failing_sweep():
+            raise RuntimeError("sweep failed")
+        
+        async def scenario():
+            registry._sweep_loop = asyncio.get_running_loop()
+            registry._run_sweep()
+            task = registry._sweep_task
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+            return task
+        
+        registry.hibernate_idle_objects = failing_sweep
+        registry._active_objects["sweep-test"] = None
+        try:
+            with self.assertLogs(durable_objects.logger, level="ERROR") as logs:
+                task = self.loop.run_until_complete(scenario())
+        finally:
+            del registry.hibernate_idle_objects
+            del registry._active_objects["sweep-test"]
+            registry._sweep_handle.cancel()
+            registry._sweep_handle = None
+        self.assertTrue(task.done())
+        self.assertIsNone(registry._sweep_task)
+        self.assertIn("sweep failed", logs.output[0])
+    
+    def test_missing_object_lookup_is_cached(self):
+        """Test that a failed lookup is not repeated against the data store."""
+        async def scenario():
+            return await registry.get_object("missing-object")
+        
+        self.assertIsNone(self.loop.run_until_complete(scenario()))
+        self.assertIn("missing-object", registry._negative)
+
+
+class TestEventBus(unittest.TestCase):
+    """Tests for event publishing."""
+    
+    def setUp(self):
+        """Create an event bus with a single recording subscriber."""
+        self.loop = asyncio.new_event_loop()
+        self.received = []
+        received = self.received
+        
+        class Subscriber:
+            async def handle_event(self, event_type, event):
+                received.append(event)
+        
+        class Registry:
+            async def get_objects(self, object_ids):
+                return [Subscriber() for _ in object_ids]
+        
+        self.bus = durable_objects.EventBus(Registry())
+        self.bus.subscribe("subscriber", "test.event")
+    
+    def tearDown(self):
+        """Close the event loop."""
+        self.loop.close()
+    
+    def test_none_is_published_as_empty_data(self):
+        """Test that publishing None delivers an empty read-only mapping."""
+        self.loop.run_until_complete(self.bus.publish("test.event", None, "source"))
+        
+        event = self.received[0]
+        self.assertEqual(dict(event["data"]), {})
+        self.assertEqual(event["metadata"]["source_id"], "source")
+        with self.assertRaises(TypeError):
+            event["data"]["key"] = "value"
+        self.assertEqual(
+            json.loads(json.dumps({part: dict(view) for part, view in event.items()}))["data"], {}
+        )
+    
+    def test_non_mapping_event_data_is_rejected(self):
+        """Test that non-mapping event data raises ValueError before delivery."""
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self.bus.publish("test.event", ["not", "a", "mapping"]))
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self.bus.publish("unsubscribed.event", "data"))
+        self.assertEqual(self.received, [])
+
+
+class TestInMemoryDataStoreIndexes(unittest.TestCase):
+    """Tests for the in-memory data store's secondary indexes."""
+    
+    def test_list_uses_indexed_filters(self):
+        """Test that keyword filters follow creates, updates and deletes."""
+        store = InMemoryDataStore(indexed_fields=["project_id", "status"])
+        
+        async def scenario():
+            first = await store.create(DurableObject("first", "DataStorageDO", {}, "project-a", status="active"))
+            second = await store.create(DurableObject("second", "DataStorageDO", {}, "project-a"))
+            await store.create(DurableObject("third", "DataStorageDO", {}, "project-b", status="active"))
+            
+            active_in_a = await store.list(project_id="project-a", status="active")
+            
+            moved = DurableObject("second", "DataStorageDO", {}, "project-b", status="active")
+            moved.id = second.id
+            await store.update(second.id, moved)
+            await store.delete(first.id)
+            
+            return active_in_a, await store.list(project_id="project-b"), await store.list(project_id="project-a")
+        
+        loop = asyncio.new_event_loop()
+        try:
+            active_in_a, in_b, in_a = loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+        self.assertEqual([item.name for item in active_in_a], ["first"])
+        self.assertEqual(sorted(item.name for item in in_b), ["second", "third"])
+        self.assertEqual(in_a, [])
+    
+    def test_indexed_list_keeps_insertion_order(self):
+        """Test that indexed filters return items in the order they were created."""
+        store = InMemoryDataStore(indexed_fields=["project_id", "status"])
+        
+        async def scenario():
+            created = [
+                await store.create(DurableObject(f"o{i}", "DataStorageDO", {}, "project-a", status="active"))
+                for i in range(12)
+            ]
+            await store.patch(created[3].id, {"status": "hibernating"})
+            await store.patch(created[5].id, {"name": "renamed"})
+            return (
+                await store.list(project_id="project-a"),
+                await store.list(project_id="project-a", status="active"),
+            )
+        
+        loop = asyncio.new_event_loop()
+        try:
+            in_a, active_in_a = loop.run_until_complete(scenario())
+        finally:
+            loop.close()
+        names = [f"o{i}" for i in range(12)]
+        names[5] = "renamed"
+        self.assertEqual([item.name for item in in_a], names)
+        del names[3]
+        self.assertEqual([item.name for item in active_in_a], names)
+    
+    def test_indexed_and_unindexed_lists_agree(self):
+        """Test that a changed field lists the same way whether or not it is indexed."""
+        indexed = InMemoryDataStore(indexed_fields=["status", "owner"])
+        unindexed = InMemoryDataStore()
+        
+        async def scenario(store):
+            created = [
+                await store.create(DurableObject(f"o{i}", "DataStorageDO", {}, "project-a", status="active"))
+                for i in range(4)
+            ]
+            await store.patch(created[0].id, {"status": "idle"})
+            await store.patch(created[2].id, {"status": "idle"})
+            await store.patch(created[0].id, {"status": "active"})
+            return (
+                [item.name for item in await store.list(status="active")],
+                [item.name for item in await store.list(status="idle")],
+                [item.name for item in await store.list(owner="nobody")],
+                len(await store.list(owner=None)),
+            )
+        
+        loop = asyncio.new_event_loop()
+        try:
+            from_index = loop.run_until_complete(scenario(indexed))
+            from_scan = loop.run_until_complete(scenario(unindexed))
+        finally:
+            loop.close()
+        self.assertEqual(from_index, (["o0", "o1", "o3"], ["o2"], [], 4))
+        self.assertEqual(from_scan, from_index)
+
+
+class TestOpenAPISpec(unittest.TestCase):
+    """Tests for the OpenAPI specification generator."""
+    
+    def test_path_spec_matches_full_spec(self):
+        """Test that a single-path specification matches the full specification."""
+        full = openapi_spec.generate_openapi_spec()
+        mini = openapi_spec.generate_path_spec("/users/{user_id}")
+        
+        self.assertEqual(list(mini["paths"]), ["/users/{user_id}"])
+        self.assertEqual(mini["paths"]["/users/{user_id}"], full["paths"]["/users/{user_id}"])
+        self.assertEqual(mini["components"], full["components"])
+        with self.assertRaises(KeyError):
+            openapi_spec.generate_path_spec("/missing")
+    
+    def test_spec_is_read_only(self):
+        """Test that the shared specification cannot be modified by callers."""
+        spec = openapi_spec.generate_openapi_spec()
+        
+        with self.assertRaises(TypeError):
+            spec["openapi"] = "0.0.0"
+        with self.assertRaises(TypeError):
+            spec["paths"]["/users"]["get"]["summary"] = "Changed"
+        self.assertIsInstance(spec["paths"]["/users"]["get"]["tags"], tuple)
+        self.assertIs(openapi_spec.generate_openapi_spec(), spec)
+        self.assertEqual(json.loads(openapi_spec.generate_openapi_spec_json())["openapi"], spec["openapi"])
+    
+    def test_etag_matches_if_none_match(self):
+        """Test that the spec ETag short-circuits conditional requests."""
+        etag = openapi_spec.spec_etag()
+        
+        self.assertTrue(openapi_spec.spec_not_modified(etag))
+        self.assertTrue(openapi_spec.spec_not_modified(f'"other", W/{etag}'))
+        self.assertFalse(openapi_spec.spec_not_modified('"other"'))
+        self.assertFalse(openapi_spec.spec_not_modified(None))
+    
+    def test_spec_response_negotiates_gzip(self):
+        """Test that the spec response honours Accept-Encoding and If-None-Match."""
+        status, headers, body = openapi_spec.openapi_spec_response("br, gzip")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(body), openapi_spec.generate_openapi_spec_json())
+        
+        status, headers, body = openapi_spec.openapi_spec_response(None, headers["ETag"])
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+    
+    def test_validate_spec_rejects_dangling_refs(self):
+        """Test that validation catches references to missing components."""
+        spec = json.loads(openapi_spec.generate_openapi_spec_json())
+        openapi_spec.validate_spec(spec)
+        
+        del spec["components"]["responses"]["Forbidden"]
+        with self.assertRaises(ValueError):
+            openapi_spec.validate_spec(spec)
+    
+    def test_loaded_spec_shares_identical_subtrees(self):
+        """Test that duplicate fragments of the loaded spec are stored once."""
+        user_path = openapi_spec.generate_openapi_spec()["paths"]["/users/{user_id}"]
+        
+        self.assertIs(user_path["get"]["parameters"][0], user_path["put"]["parameters"][0])
+        self.assertIs(user_path["get"]["responses"]["404"], user_path["put"]["responses"]["404"])
+    
+    def test_spec_file_matches_builder(self):
+        """Test that the bundled spec file was regenerated after builder changes."""
+        self.assertTrue(
+            openapi_spec.check_spec_file(),
+            "openapi_spec.json is stale; run python -m src.orchestration.openapi_spec --write"
+        )
+    
+    def test_streamed_spec_matches_cached_json(self):
+        """Test that the chunked serialization produces the same document."""
+        chunks = list(openapi_spec.iter_openapi_spec_json())
+        
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual(b"".join(chunks), openapi_spec.generate_openapi_spec_json())
+    
+    def test_endpoint_keys(self):
+        """Test that endpoint keys cover every documented operation."""
+        keys = openapi_spec.endpoint_keys()
+        
+        self.assertIn(("/users/{user_id}", "put"), keys)
+        self.assertNotIn(("/users/{user_id}", "delete"), keys)
+        self.assertEqual(len(keys), len(openapi_spec._endpoints()))
+    
+    def test_success_messages_keep_operation_descriptions(self):
+        """Test that shared SuccessMessage bodies keep their specific success descriptions."""
+        spec = json.loads(openapi_spec.generate_openapi_spec_json())
+        openapi_spec.validate_spec(spec)
+        
+        def success_description(path, method):
+            schema = spec["paths"][path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+            self.assertEqual(schema["allOf"][0], {"$ref": "#/components/schemas/SuccessMessage"})
+            return schema["allOf"][1]["properties"]["success"]["description"]
+        
+        self.assertEqual(success_description("/auth/logout", "post"), "Whether the logout was successful")
+        self.assertEqual(success_description("/users/{user_id}", "put"), "Whether the update was successful")
+    
+    def test_clear_spec_cache_clears_builder_caches(self):
+        """Test that clearing the spec cache also drops the builder's cached parts."""
+        openapi_spec.generate_spec_skeleton()
+        openapi_spec.generate_path_spec("/auth/logout")
+        openapi_spec.generate_openapi_spec()
+        
+        openapi_spec.clear_spec_cache()
+        
+        for accessor in (
+            openapi_spec.generate_spec_skeleton, openapi_spec.generate_path_spec,
+            openapi_spec._path_items, openapi_spec._endpoints, openapi_spec.generate_openapi_spec
+        ):
+            self.assertEqual(accessor.cache_info().currsize, 0, accessor.__name__)
+    
+    def test_path_items_merge_non_adjacent_operations(self):
+        """Test that operations of one path listed apart end up in one path item."""
+        endpoints = [
+            ("/a", "get", {"summary": "get a"}),
+            ("/b", "get", {"summary": "get b"}),
+            ("/a", "post", {"summary": "post a"}),
+        ]
+        original = openapi_spec._endpoints
+        openapi_spec._path_items.cache_clear()
+        openapi_spec._endpoints = lambda: endpoints
+        try:
+            items = openapi_spec._path_items()
+        finally:
+            openapi_spec._endpoints = original
+            openapi_spec._path_items.cache_clear()
+        self.assertEqual(items, {
+            "/a": {"get": {"summary": "get a"}, "post": {"summary": "post a"}},
+            "/b": {"get": {"summary": "get b"}},
+        })
+    
+    def test_compiled_request_validator(self):
+        """Test that request bodies are validated against the operation schema."""
+        try:
+            validate = openapi_spec.get_compiled_validator("/auth/login", "post")
+        except RuntimeError:
+            self.skipTest("no JSON Schema validator installed")
+        
+        self.assertIs(openapi_spec.get_compiled_validator("/auth/login", "post"), validate)
+        validate({"username": "alice", "password": "secret"})
+        with self.assertRaises(ValueError):
+            validate({"username": "alice"})
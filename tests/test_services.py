@@ -0,0 +1,157 @@
+"""
+Tests for the AIDevOS service Durable Objects.
+
+This module contains tests for the user and data services, including
+session handling and the batch data item operations.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.services.data_service import ERROR_ACCESS_DENIED, ERROR_NOT_FOUND, DataService
+from src.services.user_service import UserService
+
+
+class TestUserServiceSessions(unittest.TestCase):
+    """Tests for the User Service's session expiry."""
+    
+    def setUp(self):
+        """Create a user service with one user."""
+        self.user_service = UserService({})
+        self.user_service.create_user("alice", "password", "alice@example.com")
+    
+    def test_sweep_removes_only_expired_sessions(self):
+        """Test that the sweep removes expired sessions and skips stale heap entries."""
+        day = 24 * 60 * 60
+        with patch("src.services.user_service.time.time") as clock:
+            clock.return_value = 1000.0
+            expiring = self.user_service.authenticate("alice", "password")["session_id"]
+            logged_out = self.user_service.authenticate("alice", "password")["session_id"]
+            self.user_service.logout(logged_out)
+            
+            clock.return_value = 1000.0 + day / 2
+            current = self.user_service.authenticate("alice", "password")["session_id"]
+            
+            clock.return_value = 1000.0 + day + 1
+            removed = self.user_service.sweep_expired()
+            validation = self.user_service.validate_session(current)
+        
+        self.assertEqual(removed, 1)
+        self.assertNotIn(expiring, self.user_service.sessions)
+        self.assertIn(current, self.user_service.sessions)
+        self.assertTrue(validation["valid"])
+        self.assertEqual(len(self.user_service._expiry_heap), 1)
+    
+    def test_validation_sweeps_only_after_an_expiry(self):
+        """Test that validation only sweeps once the earliest session has expired."""
+        day = 24 * 60 * 60
+        with patch("src.services.user_service.time.time") as clock:
+            clock.return_value = 1000.0
+            first = self.user_service.authenticate("alice", "password")["session_id"]
+            clock.return_value = 1000.0 + day / 2
+            second = self.user_service.authenticate("alice", "password")["session_id"]
+            
+            with patch.object(UserService, "sweep_expired") as sweep:
+                self.user_service.validate_session(second)
+                sweep.assert_not_called()
+            
+            clock.return_value = 1000.0 + day + 1
+            self.assertTrue(self.user_service.validate_session(second)["valid"])
+        
+        self.assertNotIn(first, self.user_service.sessions)
+
+
+class TestUserServiceIndex(unittest.TestCase):
+    """Tests for the User Service's user ID index."""
+    
+    def test_index_follows_created_users(self):
+        """Test that users_by_id maps exactly the stored users' IDs to their names."""
+        user_service = UserService({})
+        alice = user_service.create_user("alice", "password", "alice@example.com")["id"]
+        user_service.create_user("bob", "password", "bob@example.com")
+        
+        self.assertIn("error", user_service.create_user("alice", "other", "other@example.com"))
+        self.assertEqual(
+            user_service.users_by_id,
+            {user["id"]: username for username, user in user_service.users.items()}
+        )
+        self.assertEqual(user_service.get_user(alice)["email"], "alice@example.com")
+        self.assertIn("error", user_service.get_user("missing-user"))
+
+
+class TestDataServiceBatches(unittest.TestCase):
+    """Tests for the Data Service's batch create and delete operations."""
+    
+    def setUp(self):
+        """Create a data service backed by a user service with two sessions."""
+        self.user_service = UserService({})
+        self.data_service = DataService({})
+        self.data_service.set_user_service(self.user_service)
+        self.sessions = {}
+        for username in ("alice", "bob"):
+            self.user_service.create_user(username, "password", f"{username}@example.com")
+            self.sessions[username] = self.user_service.authenticate(username, "password")
+    
+    def create(self, username, items):
+        """Create a batch of items as the given user and return their IDs."""
+        result = self.data_service.create_data_items(self.sessions[username]["session_id"], items)
+        return [item["id"] for item in result["items"]]
+    
+    def test_create_data_items_keeps_input_order(self):
+        """Test that a batch is created in input order and indexed by type."""
+        ids = self.create("alice", [("note", {"n": 1}), ("task", {"n": 2}), ("note", {"n": 3})])
+        session_id = self.sessions["alice"]["session_id"]
+        
+        listed = self.data_service.list_data_items(session_id)["items"]
+        notes = self.data_service.list_data_items(session_id, "note")["items"]
+        
+        self.assertEqual([item["id"] for item in listed], ids)
+        self.assertEqual([item["id"] for item in notes], [ids[0], ids[2]])
+        self.assertEqual(self.data_service.get_data_item(session_id, ids[1])["content"], {"n": 2})
+    
+    def test_batches_require_a_valid_session(self):
+        """Test that an unknown session creates and deletes nothing."""
+        ids = self.create("alice", [("note", {})])
+        
+        created = self.data_service.create_data_items("missing-session", [("note", {})])
+        deleted = self.data_service.delete_data_items("missing-session", ids)
+        
+        self.assertIn("error", created)
+        self.assertIn("error", deleted)
+        self.assertEqual(list(self.data_service.data_store), ids)
+    
+    def test_delete_data_items_reports_partial_failures(self):
+        """Test that missing and foreign items fail without stopping the batch."""
+        alice_ids = self.create("alice", [("note", {}), ("note", {})])
+        bob_ids = self.create("bob", [("note", {})])
+        
+        result = self.data_service.delete_data_items(
+            self.sessions["alice"]["session_id"],
+            [alice_ids[0], "missing-item", bob_ids[0], alice_ids[1]]
+        )
+        
+        self.assertEqual(result["deleted"], alice_ids)
+        self.assertEqual(result["failed"], [
+            {"id": "missing-item", "error": ERROR_NOT_FOUND},
+            {"id": bob_ids[0], "error": ERROR_ACCESS_DENIED},
+        ])
+        self.assertEqual(list(self.data_service.data_store), bob_ids)
+    
+    def test_delete_data_items_cleans_up_indexes(self):
+        """Test that emptied owner and owner/type index buckets are removed."""
+        alice_id = self.sessions["alice"]["user_id"]
+        ids = self.create("alice", [("note", {}), ("task", {})])
+        session_id = self.sessions["alice"]["session_id"]
+        
+        self.data_service.delete_data_items(session_id, [ids[0]])
+        self.assertNotIn((alice_id, "note"), self.data_service.by_owner_type)
+        self.assertEqual(list(self.data_service.by_owner[alice_id]), [ids[1]])
+        
+        self.data_service.delete_data_items(session_id, [ids[1]])
+        self.assertNotIn(alice_id, self.data_service.by_owner)
+        self.assertEqual(self.data_service.by_owner_type, {})
+        self.assertEqual(self.data_service.list_data_items(session_id), {"items": []})
+
+
+if __name__ == '__main__':
+    unittest.main()